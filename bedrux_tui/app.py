@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
+import os
 import textwrap
+from collections import deque
 
 import psutil
 from textual import events
 from textual.app import App, ComposeResult
+from textual.timer import Timer
 from textual.widgets import Input
 
 from .config import AppConfig
 from .controller import ServerController
+from .downloader import close_session
 from .installations import Installation
 from .log_buffer import LogBuffer
 from .screens import MenuScreen
@@ -35,19 +40,49 @@ class BedruxMonitorApp(App):
         self.current_installation: Installation | None = None
 
         self._server_start_time: datetime.datetime | None = None
+        self._proc_cache: tuple[int, psutil.Process] | None = None
+        self._stats_ticker_started = False
+        self._stats_tfd: int | None = None
         self._log_buffer = LogBuffer(max_messages=self.config.log_buffer_max)
-        self._sampler = StatsSampler(cpu_history_size=self.config.cpu_history_size)
-        self.cmd_history: list[str] = []
+        self._pending: deque[str] = deque()
+        self._flush_scheduled = False
+        self._wrapper: textwrap.TextWrapper | None = None
+        self._wrapper_width = 0
+        self._last_reflow_width: int | None = None
+        self._resize_timer: Timer | None = None
+
+        # Widget refs published by MonitorScreen on mount (cleared on unmount)
+        # so per-tick and per-line paths skip the DOM query walk.
+        self._stats_widget: ServerStatsWidget | None = None
+        self._log_widget: ClickableRichLog | None = None
+        self._sampler = StatsSampler(
+            cpu_history_size=self.config.cpu_history_size,
+            min_interval=self.config.stats_interval_s * 0.9,
+        )
+        self.cmd_history: deque[str] = deque(maxlen=200)
 
     def compose(self) -> ComposeResult:
         # Screens handle layout.
         yield from ()
 
     def on_mount(self) -> None:
+        # Eager tasks (3.12+) run a coroutine's synchronous prefix inline, so
+        # click-triggered workers that fail fast (validation, nothing
+        # selected) never pay a full loop iteration.
+        if hasattr(asyncio, "eager_task_factory"):
+            try:
+                asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+            except Exception:
+                pass
+
         self.write_console("Ready.")
         self.push_screen(MenuScreen())
         self._apply_layout_mode()
 
+        # One app-lifetime ticker; _tick_stats no-ops while no monitor
+        # screen is mounted, so re-entering the screen can't stack timers.
+        self.start_stats_ticker()
+
     async def start_installation(self, installation: Installation) -> None:
         if self.controller and self.controller.is_running():
             self.write_console("Server is already running.")
@@ -82,6 +117,10 @@ class BedruxMonitorApp(App):
 
     async def action_quit(self) -> None:
         await self.stop_if_running()
+        try:
+            await close_session()
+        except Exception:
+            pass
         self.exit()
 
     async def stop_current_if_running(self, installation: Installation) -> None:
@@ -97,13 +136,12 @@ class BedruxMonitorApp(App):
         if command:
             if not self.cmd_history or self.cmd_history[-1] != command:
                 self.cmd_history.append(command)
-                self.cmd_history = self.cmd_history[-200:]
 
         # Clear the input widget - search in the active screen's DOM
         try:
             inp = self.screen.query_one("#command_input", HistoryInput)
             inp.value = ""
-            inp._hist_pos = None
+            inp._hist_offset = -1
         except Exception:
             return
 
@@ -121,6 +159,14 @@ class BedruxMonitorApp(App):
             self.write_console(f"Failed to send command: {exc}")
 
     def on_resize(self, event: events.Resize) -> None:
+        # Interactive drag-resize fires one event per cell; coalesce them so
+        # the O(buffer) rewrap runs once per gesture instead of per event.
+        if self._resize_timer is not None:
+            self._resize_timer.stop()
+        self._resize_timer = self.set_timer(0.05, self._do_resize)
+
+    def _do_resize(self) -> None:
+        self._resize_timer = None
         self._reflow_log()
         self._apply_layout_mode()
 
@@ -132,8 +178,10 @@ class BedruxMonitorApp(App):
             height = 0
 
         compact = height and height < 40
+        stats = self._stats_widget
+        if stats is None:
+            return
         try:
-            stats = self.screen.query_one(ServerStatsWidget)
             if compact:
                 stats.add_class("compact")
             else:
@@ -145,83 +193,171 @@ class BedruxMonitorApp(App):
         if message is None:
             return
 
-        self._log_buffer.append(str(message))
+        message = str(message)
+        self._log_buffer.append(message)
+
+        # Coalesce bursts: a chatty server streams one message per line, and
+        # wrapping + writing each one individually thrashes the layout.
+        self._pending.append(message)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.set_timer(0.03, self._flush_console)
+
+    def _get_wrapper(self, width: int) -> textwrap.TextWrapper:
+        # Building a TextWrapper per line is surprisingly costly; keep one
+        # around and rebuild only when the console width changes.
+        if self._wrapper is None or self._wrapper_width != width:
+            self._wrapper = textwrap.TextWrapper(
+                width=width,
+                drop_whitespace=False,
+                break_long_words=True,
+            )
+            self._wrapper_width = width
+        return self._wrapper
 
-        try:
-            width = max(20, self.size.width - 4)
-        except Exception:
-            width = 80
+    def _flush_console(self) -> None:
+        self._flush_scheduled = False
+        if not self._pending:
+            return
 
-        try:
-            log_widget = self.screen.query_one("#console_log", ClickableRichLog)
-        except Exception:
+        pending = list(self._pending)
+        self._pending.clear()
+
+        log_widget = self._log_widget
+        if log_widget is None:
             # Not in monitor view; keep buffer only.
             return
 
-        for part in str(message).splitlines() or [""]:
-            wrapped = textwrap.wrap(part, width=width) or [""]
-            for line in wrapped:
-                log_widget.write(line)
-
-    def _reflow_log(self) -> None:
         try:
             width = max(20, self.size.width - 4)
         except Exception:
             width = 80
 
+        # RichLog has no bulk-write API, so suppress the per-write refresh
+        # and let the whole flush land in a single repaint.
+        wrap = self._get_wrapper(width).wrap
+        with self.batch_update():
+            for message in pending:
+                # Most server lines are single-line and fit the console; skip
+                # splitlines/wrap entirely for those.
+                if len(message) <= width and "\n" not in message:
+                    log_widget.write(message)
+                    continue
+                for part in message.splitlines() or [""]:
+                    for line in wrap(part) or [""]:
+                        log_widget.write(line)
+
+    def _reflow_log(self, force: bool = False) -> None:
         try:
-            log_widget = self.screen.query_one("#console_log", ClickableRichLog)
+            width = max(20, self.size.width - 4)
         except Exception:
+            width = 80
+
+        # Vertical-only resizes (the common case) don't change wrapping, so
+        # skip the full buffer rewrap. A fresh monitor screen passes force=True
+        # because its log widget starts empty regardless of width.
+        if not force and width == self._last_reflow_width:
             return
-        log_widget.clear()
-        for line in self._log_buffer.render(width):
-            log_widget.write(line)
+        self._last_reflow_width = width
+
+        log_widget = self._log_widget
+        if log_widget is None:
+            return
+        with self.batch_update():
+            log_widget.clear()
+            for line in self._log_buffer.render(width):
+                log_widget.write(line)
 
     def _set_online(self, online: bool) -> None:
+        stats = self._stats_widget
+        if not online:
+            self._server_start_time = None
+
+        if stats is None:
+            return
         try:
-            self.screen.query_one(ServerStatsWidget).is_online = online
+            stats.is_online = online
+            if not online:
+                stats.set_uptime(None)
         except Exception:
             pass
 
-        if not online:
-            self._server_start_time = None
+    def start_stats_ticker(self) -> None:
+        """Drive `_tick_stats` at a fixed cadence.
+
+        Prefers a CLOCK_MONOTONIC timerfd (Linux, Python 3.13+) so sampling
+        intervals stay uniform without asyncio-timer drift; falls back to
+        `set_interval` elsewhere.
+        """
+        if self._stats_ticker_started:
+            return
+        self._stats_ticker_started = True
+
+        interval = self.config.stats_interval_s
+        if hasattr(os, "timerfd_create"):
             try:
-                self.screen.query_one(ServerStatsWidget).set_uptime(None)
+                tfd = os.timerfd_create(os.CLOCK_MONOTONIC, flags=os.TFD_NONBLOCK)
+                os.timerfd_settime(tfd, initial=interval, interval=interval)
+                asyncio.get_running_loop().add_reader(tfd, self._on_stats_tick, tfd)
+                self._stats_tfd = tfd
+                return
             except Exception:
                 pass
 
-    def _tick_stats(self) -> None:
+        self.set_interval(interval, self._tick_stats)
+
+    def _on_stats_tick(self, tfd: int) -> None:
         try:
-            stats = self.screen.query_one(ServerStatsWidget)
-        except Exception:
+            os.read(tfd, 8)  # clear the expiration count
+        except OSError:
+            pass
+        self._tick_stats()
+
+    def _tick_stats(self) -> None:
+        stats = self._stats_widget
+        if stats is None:
             return
 
         if not self.controller:
-            stats.is_online = False
-            stats.set_uptime(None)
+            stats.refresh_all(online=False)
             return
 
         pid = self.controller.pid
         if not pid:
-            stats.is_online = False
-            stats.set_uptime(None)
+            stats.refresh_all(online=False)
             return
 
+        # Reuse the wrapper between ticks; re-opening /proc files every
+        # second is the bulk of the sampler's own overhead.
+        if self._proc_cache and self._proc_cache[0] == pid:
+            proc = self._proc_cache[1]
+        else:
+            try:
+                proc = psutil.Process(pid)
+            except Exception:
+                self._proc_cache = None
+                stats.refresh_all(online=False)
+                return
+            self._proc_cache = (pid, proc)
+
         try:
-            proc = psutil.Process(pid)
+            with proc.oneshot():
+                sample = self._sampler.sample(proc)
         except Exception:
-            stats.is_online = False
-            stats.set_uptime(None)
+            self._proc_cache = None
+            stats.refresh_all(online=False)
             return
-
-        sample = self._sampler.sample(proc)
+        # One clock read shared by the whole frame.
+        now = datetime.datetime.now()
         if sample is not None:
-            stats.set_resources(
+            stats.refresh_all(
+                start_time=self._server_start_time,
+                now=now,
                 cpu_percent=sample.cpu_percent,
                 sys_cpu_percent=sample.sys_cpu_percent,
                 raw_cpu_sum=sample.raw_cpu_sum,
                 rss_mb=sample.rss_mb,
                 total_ram_mb=sample.total_ram_mb,
             )
-
-        stats.set_uptime(self._server_start_time)
+        else:
+            stats.refresh_all(start_time=self._server_start_time, now=now)
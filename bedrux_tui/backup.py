@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
+import os
+import shutil
 import zipfile
 from dataclasses import dataclass
 from pathlib import Path
@@ -27,6 +30,31 @@ class BackupInfo:
         return f"{self.instance_name} ({self.timestamp}) - {self.size_mb:.1f} MB"
 
 
+# Already-compressed formats: deflating these burns CPU for ~0% gain.
+_STORED_EXTS = frozenset(
+    {".png", ".jpg", ".jpeg", ".ogg", ".zip", ".gz", ".mcpack", ".mcworld", ".mcaddon"}
+)
+
+
+class _SafeNameTable(dict):
+    """str.translate table mapping filename-unsafe characters to "_".
+
+    Precomputed for ASCII; other codepoints are resolved (and memoized)
+    on first use so unicode names behave like the old per-char loop.
+    """
+
+    def __missing__(self, code: int) -> str:
+        ch = chr(code)
+        result = ch if (ch.isalnum() or ch in "-_") else "_"
+        self[code] = result
+        return result
+
+
+_SAFE_NAME_TABLE = _SafeNameTable(
+    {i: (chr(i) if chr(i).isalnum() or chr(i) in "-_" else "_") for i in range(128)}
+)
+
+
 def get_bedrux_backup_dir() -> Path:
     """Get the global bedrux backup directory."""
     return get_bedrux_home() / "backups"
@@ -42,34 +70,43 @@ def list_backups() -> list[BackupInfo]:
     if not backup_dir.exists():
         return []
 
-    backups: list[BackupInfo] = []
-    for file in backup_dir.glob("*.zip"):
-        try:
-            # Parse filename: instancename_YYYYMMDD_HHMMSS.zip
-            stem = file.stem
-            parts = stem.rsplit("_", 2)
-            if len(parts) >= 3:
-                instance_name = parts[0]
-                date_part = parts[1]
-                time_part = parts[2]
-                timestamp = f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:8]} {time_part[:2]}:{time_part[2:4]}:{time_part[4:6]}"
-            else:
-                instance_name = stem
-                timestamp = "unknown"
-
-            size_mb = file.stat().st_size / (1024 * 1024)
-            backups.append(BackupInfo(
-                path=file,
-                instance_name=instance_name,
-                timestamp=timestamp,
-                size_mb=size_mb,
-            ))
-        except Exception:
-            continue
+    # os.scandir returns entries with stat data cached from the readdir pass,
+    # so listing large backup dirs costs one syscall per entry, not two.
+    stamped: list[tuple[float, BackupInfo]] = []
+    with os.scandir(backup_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".zip"):
+                continue
+            try:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                file = Path(entry.path)
+
+                # Parse filename: instancename_YYYYMMDD_HHMMSS.zip
+                stem = file.stem
+                parts = stem.rsplit("_", 2)
+                if len(parts) >= 3:
+                    instance_name = parts[0]
+                    date_part = parts[1]
+                    time_part = parts[2]
+                    timestamp = f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:8]} {time_part[:2]}:{time_part[2:4]}:{time_part[4:6]}"
+                else:
+                    instance_name = stem
+                    timestamp = "unknown"
+
+                st = entry.stat()
+                stamped.append((st.st_mtime, BackupInfo(
+                    path=file,
+                    instance_name=instance_name,
+                    timestamp=timestamp,
+                    size_mb=st.st_size / (1024 * 1024),
+                )))
+            except Exception:
+                continue
 
     # Sort by modification time, newest first
-    backups.sort(key=lambda b: b.path.stat().st_mtime, reverse=True)
-    return backups
+    stamped.sort(key=lambda t: t[0], reverse=True)
+    return [info for _, info in stamped]
 
 
 def make_backup(
@@ -77,6 +114,7 @@ def make_backup(
     instance_name: str,
     *,
     backup_dir: Path | None = None,
+    compresslevel: int = 1,
 ) -> BackupResult:
     """
     Create a backup of the entire server instance as a zip file.
@@ -85,6 +123,7 @@ def make_backup(
         installation_path: Path to the server instance
         instance_name: Name of the instance (used in filename)
         backup_dir: Optional custom backup directory (defaults to ~/.bedrux/backups)
+        compresslevel: zlib level for deflated members (default 1: fast)
 
     Returns:
         BackupResult with the archive path
@@ -95,19 +134,56 @@ def make_backup(
 
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     # Sanitize instance name for filename
-    safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in instance_name)
+    safe_name = instance_name.translate(_SAFE_NAME_TABLE)
     archive = backup_dir / f"{safe_name}_{timestamp}.zip"
 
-    # Create zip of entire instance directory
-    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
-        for file_path in installation_path.rglob("*"):
-            if file_path.is_file():
-                arcname = file_path.relative_to(installation_path)
-                zf.write(file_path, arcname)
+    # Create zip of entire instance directory. Scan once up front, and store
+    # already-compressed assets instead of re-deflating them.
+    # Zstandard (Python 3.14+) beats deflate on both speed and ratio.
+    compression = getattr(zipfile, "ZIP_ZSTANDARD", zipfile.ZIP_DEFLATED)
+    files = [p for p in installation_path.rglob("*") if p.is_file()]
+    with zipfile.ZipFile(archive, "w", compression, compresslevel=compresslevel) as zf:
+        for file_path in files:
+            arcname = file_path.relative_to(installation_path)
+            compress_type = (
+                zipfile.ZIP_STORED
+                if file_path.suffix.lower() in _STORED_EXTS
+                else compression
+            )
+            # zf.write copies in small slices; a 1 MiB buffer moves big
+            # world files with far fewer Python-level round trips.
+            zi = zipfile.ZipInfo.from_file(file_path, str(arcname))
+            zi.compress_type = compress_type
+            # zf.open(zi, "w") reads the level off the ZipInfo, not the
+            # ZipFile; without this every entry deflates at zlib's default.
+            zi._compresslevel = compresslevel
+            with open(file_path, "rb") as src, zf.open(zi, "w") as dst:
+                shutil.copyfileobj(src, dst, length=1 << 20)
 
     return BackupResult(archive_path=archive, instance_name=instance_name)
 
 
+async def make_backup_async(
+    installation_path: Path,
+    instance_name: str,
+    *,
+    backup_dir: Path | None = None,
+    compresslevel: int = 1,
+) -> BackupResult:
+    """Run `make_backup` in a worker thread.
+
+    Compressing a large world on the event loop would freeze the whole TUI
+    for the duration of the snapshot.
+    """
+    return await asyncio.to_thread(
+        make_backup,
+        installation_path,
+        instance_name,
+        backup_dir=backup_dir,
+        compresslevel=compresslevel,
+    )
+
+
 def restore_backup(
     backup_path: Path,
     target_path: Path,
@@ -125,7 +201,6 @@ def restore_backup(
     Returns:
         Path to the restored instance directory
     """
-    import shutil
     import stat
 
     backup_path = backup_path.expanduser().resolve()
@@ -155,40 +230,42 @@ def restore_backup(
         instance_name = f"{instance_name}_restored_{timestamp}"
         instance_dir = target_path / instance_name
 
-    # Create a temp dir to extract to first
-    temp_extract_dir = target_path / f".tmp_restore_{instance_name}"
-    if temp_extract_dir.exists():
-        shutil.rmtree(temp_extract_dir)
-    temp_extract_dir.mkdir(parents=True, exist_ok=True)
-
-    try:
-        # Extract backup to temp dir
-        with zipfile.ZipFile(backup_path, "r") as zf:
-            zf.extractall(temp_extract_dir)
-
-        # Check if files are in a subdirectory (old backup format)
-        contents = list(temp_extract_dir.iterdir())
-        if len(contents) == 1 and contents[0].is_dir():
-            # Files are in a subdirectory, move them up
-            extracted_subdir = contents[0]
-            # Move the subdirectory to final location
-            shutil.move(str(extracted_subdir), str(instance_dir))
-        else:
-            # Files are directly in temp dir, move the whole thing
-            shutil.move(str(temp_extract_dir), str(instance_dir))
-            temp_extract_dir = None  # Already moved
-
-        # Set execute permissions on bedrock_server
-        server_binary = instance_dir / "bedrock_server"
-        if server_binary.exists():
-            # Make it executable (rwxr-xr-x = 0o755)
-            server_binary.chmod(stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
-
-        return instance_dir
-    finally:
-        # Clean up temp dir if it still exists
-        if temp_extract_dir and temp_extract_dir.exists():
-            shutil.rmtree(temp_extract_dir, ignore_errors=True)
+    # Extract straight to the final location. Old backups wrapped everything
+    # in a single top-level folder; detect that from the archive listing and
+    # strip the prefix per entry instead of extracting to a temp dir and
+    # moving the tree afterwards.
+    with zipfile.ZipFile(backup_path, "r") as zf:
+        infos = zf.infolist()
+        names = [zi.filename for zi in infos]
+
+        prefix = ""
+        if names:
+            top = names[0].split("/", 1)[0] + "/"
+            if all(n.startswith(top) for n in names):
+                prefix = top
+
+        instance_dir.mkdir(parents=True, exist_ok=True)
+        for zi in infos:
+            stripped = zi.filename[len(prefix):]
+            if not stripped or stripped.startswith(("/", "../")) or "/../" in stripped:
+                continue
+            target = instance_dir / stripped
+            if stripped.endswith("/"):
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Same 1 MiB buffer as the backup side; zf.extract copies in
+            # 16 KiB slices.
+            with zf.open(zi) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, length=1 << 20)
+
+    # Set execute permissions on bedrock_server
+    server_binary = instance_dir / "bedrock_server"
+    if server_binary.exists():
+        # Make it executable (rwxr-xr-x = 0o755)
+        server_binary.chmod(stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
+
+    return instance_dir
 
 
 def delete_backup(backup_path: Path) -> bool:
@@ -19,6 +19,19 @@ if str(_HERE) not in sys.path:
 
 
 def main() -> None:
+    # uvloop cuts event-loop overhead substantially on POSIX, and everything
+    # here (downloads, backups, workers) bottoms out in the loop. Optional:
+    # stdlib asyncio works fine when it isn't installed.
+    if sys.platform != "win32":
+        try:
+            import asyncio
+
+            import uvloop
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
     # Try normal package imports first (when installed)
     try:
         from bedrux_tui import BedruxMonitorApp
@@ -11,3 +11,5 @@ class AppConfig:
     stats_interval_s: float = 1.0
     cpu_history_size: int = 5
     log_buffer_max: int = 2000
+    # zlib level 1 keeps ~90% of the ratio on world data at 2-3x the speed.
+    backup_compresslevel: int = 1
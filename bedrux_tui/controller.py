@@ -4,6 +4,7 @@ import asyncio
 import os
 import re
 import signal
+import sys
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Optional
@@ -13,7 +14,9 @@ LogFn = Callable[[str], None]
 StatusFn = Callable[[bool], None]
 
 
-_ANSI_RE = re.compile(r"\x1b\[[0-9;]*[mKHF]?")
+# Bytes pattern: stripping before decode avoids allocating str content that
+# is about to be discarded.
+_ANSI_RE = re.compile(rb"\x1b\[[0-9;]*[mKHF]?")
 
 
 @dataclass(slots=True)
@@ -40,6 +43,14 @@ class ServerController:
         self._proc: Optional[asyncio.subprocess.Process] = None
         self._reader_tasks: list[asyncio.Task] = []
         self._wait_task: Optional[asyncio.Task] = None
+        # Bounded so a slow terminal can never back-pressure the pipe reader
+        # into stalling the server; overflow drops the oldest lines.
+        self._log_q: asyncio.Queue[str] = asyncio.Queue(maxsize=4096)
+
+        # POSIX fast path: raw pipe fds registered with loop.add_reader,
+        # with a residual buffer per fd for line splitting.
+        self._pipe_fds: list[int] = []
+        self._pipe_bufs: dict[int, bytearray] = {}
 
     @property
     def process(self) -> Optional[asyncio.subprocess.Process]:
@@ -61,24 +72,57 @@ class ServerController:
             self._log(f"Working directory: {self._cwd}")
         self._log(f"Starting server: {self._server_cmd}")
 
-        self._proc = await asyncio.create_subprocess_shell(
-            self._server_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            stdin=asyncio.subprocess.PIPE,
-            start_new_session=True,
-            cwd=self._cwd,
-        )
+        if sys.platform != "win32":
+            # Own the output pipes so the read ends can go straight into
+            # loop.add_reader; this skips the StreamReader's per-line
+            # coroutine round-trip entirely.
+            stdout_r, stdout_w = os.pipe()
+            stderr_r, stderr_w = os.pipe()
+            try:
+                self._proc = await asyncio.create_subprocess_shell(
+                    self._server_cmd,
+                    stdout=stdout_w,
+                    stderr=stderr_w,
+                    stdin=asyncio.subprocess.PIPE,
+                    start_new_session=True,
+                    cwd=self._cwd,
+                )
+            except Exception:
+                os.close(stdout_r)
+                os.close(stderr_r)
+                raise
+            finally:
+                os.close(stdout_w)
+                os.close(stderr_w)
+
+            loop = asyncio.get_running_loop()
+            for fd in (stdout_r, stderr_r):
+                os.set_blocking(fd, False)
+                self._pipe_bufs[fd] = bytearray()
+                self._pipe_fds.append(fd)
+                loop.add_reader(fd, self._on_pipe_readable, fd)
+
+            self._reader_tasks = [asyncio.create_task(self._drain_logs())]
+        else:
+            self._proc = await asyncio.create_subprocess_shell(
+                self._server_cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                stdin=asyncio.subprocess.PIPE,
+                start_new_session=True,
+                cwd=self._cwd,
+            )
+            self._reader_tasks = [
+                asyncio.create_task(self._read_stream(self._proc.stdout)),
+                asyncio.create_task(self._read_stream(self._proc.stderr)),
+                asyncio.create_task(self._drain_logs()),
+            ]
 
         self._on_status(True)
         pid = self.pid
         if pid is not None:
             self._log(f"Server started (PID={pid}).")
 
-        self._reader_tasks = [
-            asyncio.create_task(self._read_stream(self._proc.stdout)),
-            asyncio.create_task(self._read_stream(self._proc.stderr)),
-        ]
         self._wait_task = asyncio.create_task(self._wait_for_exit())
 
     async def stop(self) -> None:
@@ -88,12 +132,15 @@ class ServerController:
         proc = self._proc
         self._log("Stopping server...")
 
-        await self._cancel_readers()
-
         await self._close_stdin(proc)
 
         await self._terminate_process(proc)
 
+        # Tear the pipes down only after the process is gone: closing the
+        # read ends while the server is still flushing output would SIGPIPE
+        # it mid-save instead of letting it exit cleanly.
+        await self._cancel_readers()
+
         self._proc = None
         self._on_status(False)
 
@@ -109,13 +156,91 @@ class ServerController:
         if stream is None:
             return
 
+        # Read in bulk and split lines ourselves: readline() wakes the event
+        # loop once per line, which adds up during log floods.
+        buf = bytearray()
         while True:
-            line = await stream.readline()
-            if not line:
+            chunk = await stream.read(65536)
+            if not chunk:
                 break
-            decoded = line.decode("utf-8", errors="replace").rstrip("\r\n")
-            cleaned = _ANSI_RE.sub("", decoded)
-            self._log(cleaned)
+            buf += chunk
+            while (i := buf.find(b"\n")) >= 0:
+                line = bytes(buf[:i])
+                del buf[: i + 1]
+                self._emit_line(line)
+        if buf:
+            self._emit_line(bytes(buf))
+
+    def _on_pipe_readable(self, fd: int) -> None:
+        buf = self._pipe_bufs.get(fd)
+        if buf is None:
+            return
+
+        while True:
+            try:
+                chunk = os.read(fd, 65536)
+            except BlockingIOError:
+                return
+            except OSError:
+                chunk = b""
+
+            if not chunk:
+                # EOF: flush the residual and retire this pipe.
+                self._close_pipe(fd)
+                if buf:
+                    self._emit_line(bytes(buf))
+                    buf.clear()
+                return
+
+            buf += chunk
+            while (i := buf.find(b"\n")) >= 0:
+                line = bytes(buf[:i])
+                del buf[: i + 1]
+                self._emit_line(line)
+
+    def _close_pipe(self, fd: int) -> None:
+        try:
+            asyncio.get_running_loop().remove_reader(fd)
+        except Exception:
+            pass
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+        self._pipe_bufs.pop(fd, None)
+        if fd in self._pipe_fds:
+            self._pipe_fds.remove(fd)
+
+    def _close_pipes(self) -> None:
+        for fd in list(self._pipe_fds):
+            self._close_pipe(fd)
+
+    def _emit_line(self, line: bytes) -> None:
+        if b"\x1b[" in line:
+            line = _ANSI_RE.sub(b"", line)
+        text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+
+        try:
+            self._log_q.put_nowait(text)
+        except asyncio.QueueFull:
+            try:
+                self._log_q.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            try:
+                self._log_q.put_nowait(text)
+            except asyncio.QueueFull:
+                pass
+
+    async def _drain_logs(self) -> None:
+        while True:
+            self._log(await self._log_q.get())
+            # Hand any lines that arrived in the same burst over together.
+            while True:
+                try:
+                    self._log(self._log_q.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
 
     async def _wait_for_exit(self) -> None:
         proc = self._proc
@@ -132,6 +257,12 @@ class ServerController:
             self._on_status(False)
 
     async def _cancel_readers(self) -> None:
+        # Pull anything still sitting in the kernel pipe buffers before
+        # closing, then flush lines the drain task didn't get to deliver.
+        for fd in list(self._pipe_fds):
+            self._on_pipe_readable(fd)
+        self._close_pipes()
+
         tasks = [t for t in self._reader_tasks if not t.done()]
         for t in tasks:
             t.cancel()
@@ -139,6 +270,12 @@ class ServerController:
             await asyncio.gather(*tasks, return_exceptions=True)
         self._reader_tasks = []
 
+        while True:
+            try:
+                self._log(self._log_q.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
         if self._wait_task and not self._wait_task.done():
             # Let it finish naturally; no need to cancel unless we're shutting down.
             return
@@ -155,10 +292,21 @@ class ServerController:
             return
 
     async def _terminate_process(self, proc: asyncio.subprocess.Process) -> None:
+        # Bedrock usually exits on its own once stdin closes; don't signal
+        # (or wait on) a process that is already gone.
+        if proc.returncode is not None:
+            return
+
         pid = getattr(proc, "pid", None)
         if pid is None:
             return
 
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=2.0)
+            return
+        except asyncio.TimeoutError:
+            pass
+
         try:
             pgid = os.getpgid(pid)
             os.killpg(pgid, signal.SIGTERM)
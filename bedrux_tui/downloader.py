@@ -3,21 +3,44 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
+import json
 import os
-import platform
 import re
 import shutil
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Optional
 
 import aiohttp
 
+from .installations import get_server_command_for_arch, get_system_arch
+
+try:
+    # Optional: lets installs unzip straight off the socket without landing
+    # the whole archive on disk first.
+    from stream_unzip import async_stream_unzip
+except ImportError:
+    async_stream_unzip = None
+
+try:
+    # Optional: overlaps disk writes with the next network read instead of
+    # stalling the loop on each chunk.
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
 
 WIKI_URL = "https://minecraft.wiki/w/Bedrock_Dedicated_Server"
 WIKI_API_URL = "https://minecraft.wiki/api.php?action=parse&page=Bedrock_Dedicated_Server&prop=text&format=json"
 VERSION_PATTERN = re.compile(r"<b>(Release|Preview):</b>.*?>([0-9]+\.[0-9]+\.[0-9]+\.[0-9]+)")
+RELEASE_RE = re.compile(r"<b>Release:</b>.*?>(\d+\.\d+\.\d+\.\d+)")
+PREVIEW_RE = re.compile(r"<b>Preview:</b>.*?>(\d+\.\d+\.\d+\.\d+)")
+VERSION_FMT_RE = re.compile(r"^1\.\d{1,3}\.\d{1,3}\.\d{1,3}$")
 
 
 @dataclass
@@ -43,61 +66,171 @@ LogCallback = Callable[[str], None]
 ProgressCallback = Callable[[int, int], None]
 
 
-def get_system_arch() -> str:
-    """Get system architecture."""
-    return platform.machine()
+_session: Optional[aiohttp.ClientSession] = None
 
 
-def get_server_command() -> str:
-    """Get the appropriate server command based on system architecture."""
-    arch = get_system_arch()
-    if arch == "aarch64":
-        return "box64 bedrock_server"
-    elif arch == "x86_64":
-        return "./bedrock_server"
-    else:
-        # Fallback for unknown architectures
-        return "./bedrock_server"
+def get_session() -> aiohttp.ClientSession:
+    """Lazily created shared ClientSession.
+
+    Reusing one session keeps the connection pool (and its DNS cache) warm,
+    so repeated requests skip the TCP+TLS handshake.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=60),
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session (call on app shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def _fast_rmtree(path: Path | str) -> None:
+    """Remove a tree with one scandir pass per directory.
+
+    `shutil.rmtree` stats each entry again after listdir; scandir gets the
+    d_type for free, which matters on big world directories.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _fast_copytree(src: Path | str, dst: Path | str) -> None:
+    """Copy a tree, hardlinking files when source and target share a device.
+
+    A hardlink is a single syscall regardless of file size; falling back to
+    `shutil.copy2` keeps cross-device copies working with modes intact
+    (bedrock_server must stay executable after migration).
+    """
+    os.makedirs(dst, exist_ok=True)
+    try:
+        same_dev = os.stat(src).st_dev == os.stat(dst).st_dev
+    except OSError:
+        same_dev = False
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                _fast_copytree(entry.path, target)
+            elif same_dev:
+                try:
+                    os.link(entry.path, target)
+                except OSError:
+                    shutil.copy2(entry.path, target)
+            else:
+                shutil.copy2(entry.path, target)
+
+
+# Arch detection lives in installations.py; re-exported here for callers
+# that historically imported it from the downloader.
+get_server_command = get_server_command_for_arch
+
+
+# Wiki versions change on the order of weeks; an hour of staleness is fine.
+_VERSION_CACHE_TTL_S = 3600.0
+
+
+def _versions_cache_path() -> Path:
+    return get_bedrux_home() / "cache" / "versions.json"
+
+
+def _load_cached_versions(ttl: float) -> Optional[list[VersionInfo]]:
+    """Return the cached version list if it is younger than `ttl` seconds."""
+    try:
+        raw = json.loads(_versions_cache_path().read_text(encoding="utf-8"))
+        if time.time() - float(raw["fetched_at"]) > ttl:
+            return None
+        return [
+            VersionInfo(version=str(v["version"]), is_preview=bool(v["is_preview"]))
+            for v in raw["versions"]
+        ]
+    except Exception:
+        return None
+
+
+def _save_cached_versions(versions: list[VersionInfo]) -> None:
+    try:
+        path = _versions_cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "fetched_at": time.time(),
+            "versions": [
+                {"version": v.version, "is_preview": v.is_preview} for v in versions
+            ],
+        }
+        path.write_text(json.dumps(payload), encoding="utf-8")
+    except Exception:
+        # Cache is best-effort; the fetch already succeeded.
+        pass
 
 
-async def fetch_versions(log: Optional[LogCallback] = None) -> list[VersionInfo]:
-    """Fetch available versions from Minecraft wiki using curl (like svm does)."""
+async def fetch_versions(
+    log: Optional[LogCallback] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> list[VersionInfo]:
+    """Fetch available versions from the Minecraft wiki API.
+
+    Accepts an optional shared `session` so callers can reuse an existing
+    connection pool instead of paying a fresh TCP+TLS handshake. Results are
+    cached on disk for an hour (override with `BEDRUX_VERSION_TTL`; 0
+    disables the cache) so reopening the install screen skips the round-trip.
+    """
     versions: list[VersionInfo] = []
 
+    try:
+        ttl = float(os.environ.get("BEDRUX_VERSION_TTL", _VERSION_CACHE_TTL_S))
+    except ValueError:
+        ttl = _VERSION_CACHE_TTL_S
+    if ttl > 0:
+        cached = _load_cached_versions(ttl)
+        if cached is not None:
+            if log:
+                log("Using cached version list.")
+            return cached
+
     if log:
         log("Fetching versions from Minecraft Wiki...")
 
     try:
-        # Use curl like the original svm script - this works reliably
-        proc = await asyncio.create_subprocess_exec(
-            "curl", "-s", WIKI_URL,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
-
-        if proc.returncode != 0:
-            if log:
-                log("Failed to fetch versions: curl error")
-            return versions
+        if session is None:
+            session = get_session()
+        headers = {"User-Agent": "Mozilla/5.0 (compatible; BedruxClient/1.0)"}
+        async with session.get(
+            WIKI_API_URL,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=30),
+        ) as response:
+            if response.status != 200:
+                if log:
+                    log(f"Failed to fetch versions: HTTP {response.status}")
+                return versions
+            data = await response.json()
 
-        html = stdout.decode("utf-8", errors="replace")
+        html = data["parse"]["text"]["*"]
     except asyncio.TimeoutError:
         if log:
             log("Timeout while fetching versions.")
         return versions
-    except FileNotFoundError:
-        if log:
-            log("curl not found. Please install curl.")
-        return versions
     except Exception as e:
         if log:
             log(f"Error fetching versions: {e}")
         return versions
 
     # Parse versions from HTML
-    release_match = re.search(r'<b>Release:</b>.*?>(\d+\.\d+\.\d+\.\d+)', html)
-    preview_match = re.search(r'<b>Preview:</b>.*?>(\d+\.\d+\.\d+\.\d+)', html)
+    release_match = RELEASE_RE.search(html)
+    preview_match = PREVIEW_RE.search(html)
 
     if release_match:
         versions.append(VersionInfo(version=release_match.group(1), is_preview=False))
@@ -109,19 +242,25 @@ async def fetch_versions(log: Optional[LogCallback] = None) -> list[VersionInfo]
         if log:
             log(f"Found Preview: {preview_match.group(1)}")
 
-    if not versions and log:
+    if versions:
+        _save_cached_versions(versions)
+    elif log:
         log("No versions found on wiki page.")
 
     return versions
 
 
-async def check_url_exists(url: str) -> bool:
+async def check_url_exists(
+    url: str,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> bool:
     """Check if a URL exists (returns 200)."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = {"User-Agent": "Mozilla/5.0 (compatible; BedruxClient/1.0)"}
-            async with session.head(url, headers=headers, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                return response.status == 200
+        if session is None:
+            session = get_session()
+        headers = {"User-Agent": "Mozilla/5.0 (compatible; BedruxClient/1.0)"}
+        async with session.head(url, headers=headers, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            return response.status == 200
     except Exception:
         return False
 
@@ -132,17 +271,22 @@ async def make_version_url(version: str, log: Optional[LogCallback] = None) -> O
     preview_url = f"https://www.minecraft.net/bedrockdedicatedserver/bin-linux-preview/bedrock-server-{version}.zip"
 
     if log:
-        log(f"Checking release URL for version {version}...")
+        log(f"Checking URLs for version {version}...")
+
+    # Fire both HEADs concurrently over the shared session; wall time becomes
+    # max(release, preview) instead of the sum.
+    session = get_session()
+    release_ok, preview_ok = await asyncio.gather(
+        check_url_exists(release_url, session),
+        check_url_exists(preview_url, session),
+    )
 
-    if await check_url_exists(release_url):
+    if release_ok:
         if log:
             log("Release version found.")
         return release_url
 
-    if log:
-        log("Checking preview URL...")
-
-    if await check_url_exists(preview_url):
+    if preview_ok:
         if log:
             log("Preview version found.")
         return preview_url
@@ -152,6 +296,303 @@ async def make_version_url(version: str, log: Optional[LogCallback] = None) -> O
     return None
 
 
+async def _stream_extract(
+    response: aiohttp.ClientResponse,
+    instance_path: Path,
+    progress: Optional[ProgressCallback],
+    total_size: int,
+    tee_path: Optional[Path] = None,
+) -> str:
+    """Unzip the response body straight into `instance_path`.
+
+    Bytes flow socket -> inflate -> file once, instead of being written to a
+    zip on disk and then re-read for extraction. Each chunk is also folded
+    into a SHA-256 on the way through (returned as hex), and optionally teed
+    to `tee_path` when the caller wants to keep the archive.
+
+    Same bytes, one pass: hashing and persisting ride along on the transfer
+    instead of re-reading the archive afterwards.
+    """
+    downloaded = 0
+    last_reported = 0
+    hasher = hashlib.sha256()
+    tee_fd = os.open(tee_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644) if tee_path else None
+
+    async def _chunks():
+        nonlocal downloaded, last_reported
+        async for chunk in response.content.iter_chunked(1 << 20):
+            downloaded += len(chunk)
+            hasher.update(chunk)
+            if tee_fd is not None:
+                os.write(tee_fd, chunk)
+            if progress and total_size > 0 and (
+                downloaded - last_reported >= 65536 or downloaded >= total_size
+            ):
+                last_reported = downloaded
+                progress(downloaded, total_size)
+            yield chunk
+
+    try:
+        await _extract_entries(instance_path, _chunks())
+    finally:
+        if tee_fd is not None:
+            os.close(tee_fd)
+    return hasher.hexdigest()
+
+
+def _is_unsafe_member(name: str) -> bool:
+    """True for archive entry names that would escape the destination.
+
+    Same guards as restore_backup: reject empty, absolute and
+    parent-traversing names instead of trusting the archive.
+    """
+    return not name or name.startswith(("/", "../")) or "/../" in name
+
+
+async def _extract_entries(instance_path: Path, chunks) -> None:
+    async for name, _size, entry_chunks in async_stream_unzip(chunks):
+        rel = name.decode("utf-8", errors="replace")
+        if _is_unsafe_member(rel):
+            async for _ in entry_chunks:
+                pass
+            continue
+        target = instance_path / rel
+        if rel.endswith("/"):
+            async for _ in entry_chunks:
+                pass
+            target.mkdir(parents=True, exist_ok=True)
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, "wb") as f:
+            async for data in entry_chunks:
+                f.write(data)
+
+
+# Range-split downloads: four streams typically saturate a high-RTT link
+# that a single TCP connection cannot. Below ~8 MiB the extra round-trips
+# cost more than they save.
+_RANGE_PARTS = 4
+_RANGE_MIN_SIZE = 8 << 20
+
+
+async def _ranged_download(
+    session: aiohttp.ClientSession,
+    url: str,
+    headers: dict[str, str],
+    download_path: Path,
+    progress: Optional[ProgressCallback],
+) -> Optional[int]:
+    """Fetch `url` over N parallel Range requests into `download_path`.
+
+    Returns the total size on success, or None when the server doesn't
+    advertise range support (or anything goes wrong) so the caller can fall
+    back to the plain single-stream download.
+    """
+    try:
+        async with session.head(
+            url,
+            headers=headers,
+            allow_redirects=True,
+            timeout=aiohttp.ClientTimeout(total=30),
+        ) as head:
+            if head.status != 200:
+                return None
+            if head.headers.get("Accept-Ranges", "").lower() != "bytes":
+                return None
+            total_size = int(head.headers.get("Content-Length", 0))
+    except Exception:
+        return None
+
+    if total_size < _RANGE_MIN_SIZE:
+        return None
+
+    downloaded = 0
+    last_reported = 0
+
+    def _report(n: int) -> None:
+        nonlocal downloaded, last_reported
+        downloaded += n
+        if progress and (downloaded - last_reported >= 65536 or downloaded >= total_size):
+            last_reported = downloaded
+            progress(downloaded, total_size)
+
+    fd = os.open(download_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+    async def _fetch_part(start: int, end: int) -> None:
+        offset = start
+        part_headers = dict(headers)
+        part_headers["Range"] = f"bytes={start}-{end}"
+        async with session.get(
+            url,
+            headers=part_headers,
+            timeout=aiohttp.ClientTimeout(total=600),
+        ) as resp:
+            if resp.status != 206:
+                raise OSError(f"range not honored: HTTP {resp.status}")
+            async for chunk in resp.content.iter_chunked(1 << 20):
+                # pwrite lands each part at its own offset; no shared file
+                # position, so the streams never contend.
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+                _report(len(chunk))
+
+    try:
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, total_size)
+            except OSError:
+                pass
+        part = total_size // _RANGE_PARTS
+        bounds = [
+            (i * part, total_size - 1 if i == _RANGE_PARTS - 1 else (i + 1) * part - 1)
+            for i in range(_RANGE_PARTS)
+        ]
+        # TaskGroup cancels the sibling streams when one part fails and
+        # waits for all of them to settle, so no orphaned pwrite can land in
+        # whatever file reuses this fd after the close below.
+        async with asyncio.TaskGroup() as tg:
+            for a, b in bounds:
+                tg.create_task(_fetch_part(a, b))
+    except Exception:
+        return None
+    finally:
+        os.close(fd)
+    return total_size
+
+
+def _extract_archive(download_path: Path, instance_path: Path) -> None:
+    """Extract a zip using one worker thread per core.
+
+    zlib releases the GIL while inflating, so the many entries of a BDS
+    archive decompress in parallel. Each worker opens its own ZipFile handle
+    because a single handle is not safe for concurrent reads.
+    """
+    with zipfile.ZipFile(download_path) as zf:
+        infos = [i for i in zf.infolist() if not _is_unsafe_member(i.filename)]
+
+    # Build the directory tree single-threaded before fanning out.
+    for info in infos:
+        target = instance_path / info.filename
+        if info.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+
+    file_infos = [info for info in infos if not info.is_dir()]
+    workers = min(os.cpu_count() or 1, 8)
+
+    def _extract_batch(batch: list[zipfile.ZipInfo]) -> None:
+        # zf.open + a 1 MiB copy buffer instead of zf.extract: extract()
+        # copies in 16 KiB slices, which pushes tiny reads through zlib and
+        # tiny writes to disk.
+        with zipfile.ZipFile(download_path) as zf:
+            for info in batch:
+                target = instance_path / info.filename
+                with zf.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, length=1 << 20)
+
+    if workers <= 1 or len(file_infos) < 2:
+        _extract_batch(file_infos)
+        return
+
+    batches = [file_infos[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(_extract_batch, batches))
+
+
+async def _single_download(
+    session: aiohttp.ClientSession,
+    url: str,
+    headers: dict[str, str],
+    instance_path: Path,
+    download_path: Optional[Path],
+    stream_extract: bool,
+    keep_downloads: bool,
+    progress: Optional[ProgressCallback],
+    log: Optional[LogCallback],
+) -> None:
+    """One-connection download: stream-extract or buffer to `download_path`.
+
+    Raises on HTTP errors so `download_and_install` handles cleanup in one
+    place.
+    """
+    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=600)) as response:
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status}")
+
+        total_size = int(response.headers.get('content-length', 0))
+
+        if stream_extract:
+            instance_path.mkdir(parents=True, exist_ok=True)
+            digest = await _stream_extract(
+                response,
+                instance_path,
+                progress,
+                total_size,
+                tee_path=download_path if keep_downloads else None,
+            )
+            if log:
+                log(f"[i] SHA-256: {digest}")
+            return
+
+        # 1 MiB chunks: tiny chunks spend more time in the event loop
+        # than on the wire, and progress callbacks are throttled so
+        # the UI isn't redrawn per network packet. With aiofiles the
+        # write lands in a worker thread while the next chunk is
+        # already being received; otherwise fall back to raw-fd writes.
+        downloaded = 0
+        last_reported = 0
+        if aiofiles is not None:
+            # Preallocate the final size so the extent map isn't grown one
+            # append at a time; reopen r+b to keep the allocation.
+            mode = "wb"
+            if total_size > 0 and hasattr(os, "posix_fallocate"):
+                try:
+                    fd = os.open(download_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                    try:
+                        os.posix_fallocate(fd, 0, total_size)
+                        os.posix_fadvise(fd, 0, total_size, os.POSIX_FADV_SEQUENTIAL)
+                        mode = "r+b"
+                    finally:
+                        os.close(fd)
+                except OSError:
+                    pass
+            async with aiofiles.open(download_path, mode) as f:
+                async for chunk in response.content.iter_chunked(1 << 20):
+                    await f.write(chunk)
+                    downloaded += len(chunk)
+                    if progress and total_size > 0 and (
+                        downloaded - last_reported >= 65536
+                        or downloaded >= total_size
+                    ):
+                        last_reported = downloaded
+                        progress(downloaded, total_size)
+        else:
+            fd = os.open(download_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                if total_size > 0 and hasattr(os, "posix_fallocate"):
+                    try:
+                        os.posix_fallocate(fd, 0, total_size)
+                    except OSError:
+                        pass
+                if hasattr(os, "posix_fadvise"):
+                    try:
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    except OSError:
+                        pass
+                async for chunk in response.content.iter_chunked(1 << 20):
+                    os.write(fd, chunk)
+                    downloaded += len(chunk)
+                    if progress and total_size > 0 and (
+                        downloaded - last_reported >= 65536
+                        or downloaded >= total_size
+                    ):
+                        last_reported = downloaded
+                        progress(downloaded, total_size)
+            finally:
+                os.close(fd)
+
+
 async def download_and_install(
     url: str,
     instance_name: str,
@@ -206,99 +647,170 @@ async def download_and_install(
             log(f"Removing existing instance '{instance_name}'...")
 
         try:
-            shutil.rmtree(instance_path)
-        except Exception as e:
-            if log:
-                log(f"Failed to remove existing instance: {e}")
-            return False
+            # Rename out of the way first (one syscall), then delete the old
+            # tree off the event loop so the install isn't gated on it.
+            old_path = instance_path.with_name(instance_path.name + ".old")
+            if old_path.exists():
+                _fast_rmtree(old_path)
+            os.rename(instance_path, old_path)
+            future = asyncio.get_running_loop().run_in_executor(
+                None, _fast_rmtree, old_path
+            )
+            # Consume (and surface) a failed background delete instead of
+            # leaving an unretrieved-exception warning behind.
+            future.add_done_callback(
+                lambda f: (
+                    log(f"Failed to clean up old instance: {f.exception()}")
+                    if f.exception() and log
+                    else None
+                )
+            )
+        except Exception:
+            try:
+                await asyncio.to_thread(_fast_rmtree, instance_path)
+            except Exception as e:
+                if log:
+                    log(f"Failed to remove existing instance: {e}")
+                return False
 
     # Extract filename from URL
     filename = url.split("/")[-1]
 
-    # Download target: persistent downloads dir or a temporary file
+    # Stream socket->files whenever stream_unzip is available; when the zip
+    # is wanted on disk it is teed out during the same pass. Without
+    # stream_unzip, buffer to the downloads dir / a temp file as before.
+    stream_extract = async_stream_unzip is not None
+
+    download_path: Optional[Path] = None
     if use_downloads:
         download_path = downloads_dir / filename
-    else:
+    elif not stream_extract:
         import tempfile
         tf = tempfile.NamedTemporaryFile(delete=False, suffix=".zip")
         download_path = Path(tf.name)
         tf.close()
 
-    if log:
-        log(f"[+] Downloading {filename}...")
-
-    # Download the file
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = {"User-Agent": "Mozilla/5.0 (compatible; BedruxClient/1.0)"}
-            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=600)) as response:
-                if response.status != 200:
-                    if log:
-                        log(f"Download failed: HTTP {response.status}")
-                    # cleanup temp file if used
-                    if not use_downloads and download_path.exists():
-                        download_path.unlink()
-                    return False
-
-                total_size = int(response.headers.get('content-length', 0))
-                downloaded = 0
-
-                with open(download_path, 'wb') as f:
-                    async for chunk in response.content.iter_chunked(8192):
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if progress and total_size > 0:
-                            progress(downloaded, total_size)
-
-        if log:
-            log("[+] Download complete.")
+    def _cleanup_partial() -> None:
+        if download_path is not None and download_path.exists():
+            download_path.unlink()
+        if stream_extract and instance_path.exists():
+            shutil.rmtree(instance_path, ignore_errors=True)
+
+    session = get_session()
+    headers = {"User-Agent": "Mozilla/5.0 (compatible; BedruxClient/1.0)"}
+
+    # Reinstalling the same version with a kept download? One HEAD against
+    # the cached zip's size (+ ETag sidecar when both sides have one) beats
+    # re-fetching 100+ MB.
+    etag_path = download_path.with_suffix(".etag") if download_path is not None else None
+    remote_etag = ""
+    cached = False
+    if use_downloads and download_path is not None:
+        try:
+            async with session.head(
+                url,
+                headers=headers,
+                allow_redirects=True,
+                timeout=aiohttp.ClientTimeout(total=15),
+            ) as h:
+                if h.status == 200:
+                    remote_size = int(h.headers.get("Content-Length", -1))
+                    remote_etag = h.headers.get("ETag", "")
+                    if (
+                        download_path.exists()
+                        and remote_size > 0
+                        and download_path.stat().st_size == remote_size
+                    ):
+                        stored = etag_path.read_text() if etag_path.exists() else ""
+                        cached = not remote_etag or not stored or stored == remote_etag
+        except Exception:
+            cached = False
 
-    except asyncio.TimeoutError:
+    if cached:
+        # Extract the archive already on disk; no body transfer needed.
+        stream_extract = False
         if log:
-            log("Download timed out.")
-        if download_path.exists():
-            download_path.unlink()
-        return False
-    except Exception as e:
+            log(f"[+] Using cached {filename}.")
+    else:
         if log:
-            log(f"Download failed: {e}")
-        if download_path.exists():
-            download_path.unlink()
-        return False
+            log(f"[+] Downloading {filename}...")
 
-    # Extract the zip file
-    if log:
-        log("[+] Extracting...")
+        try:
+            # Buffered path: try a 4-way ranged download first; the CDN
+            # supports it and a single connection rarely fills a
+            # high-latency pipe.
+            ranged_size: Optional[int] = None
+            if not stream_extract:
+                ranged_size = await _ranged_download(session, url, headers, download_path, progress)
+
+            if ranged_size is None:
+                await _single_download(
+                    session,
+                    url,
+                    headers,
+                    instance_path,
+                    download_path,
+                    stream_extract,
+                    keep_downloads,
+                    progress,
+                    log,
+                )
+
+            if use_downloads and keep_downloads and remote_etag and etag_path is not None:
+                try:
+                    etag_path.write_text(remote_etag)
+                except Exception:
+                    pass
 
-    try:
-        instance_path.mkdir(parents=True, exist_ok=True)
+            if log:
+                log("[+] Download complete.")
 
-        with zipfile.ZipFile(download_path, 'r') as zip_ref:
-            zip_ref.extractall(instance_path)
+        except asyncio.TimeoutError:
+            if log:
+                log("Download timed out.")
+            _cleanup_partial()
+            return False
+        except Exception as e:
+            if log:
+                log(f"Download failed: {e}")
+            _cleanup_partial()
+            return False
 
+    # Extract the zip file (already done in the streaming path)
+    if not stream_extract:
         if log:
-            log("[+] Extraction complete.")
+            log("[+] Extracting...")
 
-    except zipfile.BadZipFile:
-        if log:
-            log("Failed: Downloaded file is not a valid zip archive.")
-        if download_path.exists():
-            download_path.unlink()
-        if instance_path.exists():
-            shutil.rmtree(instance_path)
-        return False
-    except Exception as e:
-        if log:
-            log(f"Extraction failed: {e}")
-        if download_path.exists():
-            download_path.unlink()
-        if instance_path.exists():
-            shutil.rmtree(instance_path)
-        return False
+        try:
+            instance_path.mkdir(parents=True, exist_ok=True)
+
+            # Off the loop: inflating hundreds of entries would otherwise
+            # stall progress callbacks and the rest of the TUI.
+            await asyncio.to_thread(_extract_archive, download_path, instance_path)
+
+            if log:
+                log("[+] Extraction complete.")
+
+        except zipfile.BadZipFile:
+            if log:
+                log("Failed: Downloaded file is not a valid zip archive.")
+            if download_path.exists():
+                download_path.unlink()
+            if instance_path.exists():
+                shutil.rmtree(instance_path)
+            return False
+        except Exception as e:
+            if log:
+                log(f"Extraction failed: {e}")
+            if download_path.exists():
+                download_path.unlink()
+            if instance_path.exists():
+                shutil.rmtree(instance_path)
+            return False
 
     # Clean up download if using temp or if user doesn't want to keep downloads
     try:
-        if (not use_downloads) or (use_downloads and not keep_downloads):
+        if download_path is not None and ((not use_downloads) or not keep_downloads):
             if download_path.exists():
                 download_path.unlink()
                 if log:
@@ -310,7 +822,7 @@ async def download_and_install(
     server_bin = instance_path / "bedrock_server"
     if server_bin.exists():
         try:
-            os.chmod(server_bin, 0o755)
+            await asyncio.to_thread(os.chmod, server_bin, 0o755)
             if log:
                 log("[+] Made bedrock_server executable.")
         except Exception as e:
@@ -329,8 +841,13 @@ async def download_and_install(
 
 def validate_version_format(version: str) -> bool:
     """Validate version string format (e.g., 1.21.0.3)."""
-    pattern = r'^1\.\d{1,3}\.\d{1,3}\.\d{1,3}$'
-    return bool(re.match(pattern, version))
+    return bool(VERSION_FMT_RE.match(version))
+
+
+# Validation runs on every keystroke in the name field; one regex pass beats
+# scanning the string once per forbidden character.
+_INVALID_RE = re.compile(r'[/\\:*?"<>|\n\r\t]')
+_RESERVED = frozenset({".", "..", "CON", "PRN", "AUX", "NUL"})
 
 
 def validate_instance_name(name: str) -> tuple[bool, str]:
@@ -346,22 +863,24 @@ def validate_instance_name(name: str) -> tuple[bool, str]:
     if len(name) > 64:
         return False, "Instance name is too long (max 64 characters)."
 
-    # Check for invalid characters
-    invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|', '\n', '\r', '\t']
-    for char in invalid_chars:
-        if char in name:
-            return False, f"Instance name cannot contain '{char}'."
+    m = _INVALID_RE.search(name)
+    if m:
+        return False, f"Instance name cannot contain '{m.group(0)}'."
 
-    # Check for reserved names
-    reserved = ['.', '..', 'CON', 'PRN', 'AUX', 'NUL']
-    if name.upper() in reserved:
+    if name.upper() in _RESERVED:
         return False, f"'{name}' is a reserved name."
 
     return True, ""
 
 
+@functools.lru_cache(maxsize=1)
 def get_bedrux_home() -> Path:
-    """Get the bedrux home directory."""
+    """Get the bedrux home directory.
+
+    Cached: hot paths resolve this repeatedly and neither the env override
+    nor the euid changes mid-run. Call `get_bedrux_home.cache_clear()` if a
+    test needs to repoint `BEDRUX_HOME`.
+    """
     # Allow overriding the base location via environment variable for flexibility
     env = os.environ.get("BEDRUX_HOME")
     if env:
@@ -404,7 +923,7 @@ def ensure_bedrux_home(migrate_from_opt: bool = True) -> Path:
                         src = item
                         dest = target / item.name
                         if src.is_dir():
-                            shutil.copytree(src, dest)
+                            _fast_copytree(src, dest)
                         else:
                             shutil.copy2(src, dest)
         except Exception:
@@ -1,16 +1,44 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 import platform
-from dataclasses import asdict, dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+try:
+    # Optional: parses bytes directly, skipping the str decode stdlib json
+    # forces on load.
+    import orjson
 
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=1)
+def get_system_arch() -> str:
+    """Get system architecture."""
+    return platform.machine()
+
+
+@functools.lru_cache(maxsize=1)
 def get_server_command_for_arch() -> str:
     """Get the appropriate server command based on system architecture."""
-    arch = platform.machine()
+    # The machine arch can't change while we're running, so both helpers are
+    # cached; platform.machine() is not free on first call.
+    arch = get_system_arch()
     if arch == "aarch64":
         return "box64 bedrock_server"
     elif arch == "x86_64":
@@ -29,9 +57,16 @@ class Installation:
     name: str
     path: str
     server_cmd: str = DEFAULT_SERVER_CMD
+    # Memoized expanduser+resolve result; excluded from equality and the
+    # saved store payload.
+    _resolved: Path | None = field(default=None, compare=False, repr=False)
 
     def resolved_path(self) -> Path:
-        return Path(self.path).expanduser().resolve()
+        # resolve() hits the filesystem; callers re-ask constantly and the
+        # answer can't change for a frozen instance.
+        if self._resolved is None:
+            object.__setattr__(self, "_resolved", Path(self.path).expanduser().resolve())
+        return self._resolved
 
 
 def default_store_path() -> Path:
@@ -49,7 +84,7 @@ class InstallationStore:
         if not path.exists():
             return []
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = _loads(path.read_bytes())
         except Exception:
             return []
 
@@ -63,32 +98,49 @@ class InstallationStore:
 
     def save(self, installations: list[Installation]) -> None:
         self.store_path.parent.mkdir(parents=True, exist_ok=True)
-        payload = [asdict(i) for i in installations]
-        self.store_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        payload = [
+            {"name": i.name, "path": i.path, "server_cmd": i.server_cmd}
+            for i in installations
+        ]
+        self.store_path.write_bytes(_dumps(payload))
+
+
+def _scan_root(root: Path) -> list[Installation]:
+    try:
+        root = root.expanduser().resolve()
+    except Exception:
+        return []
+    if not root.is_dir():
+        return []
+
+    # Direct root is an installation
+    if _has_bedrock_binary(root):
+        return [Installation(name=root.name, path=str(root))]
+
+    # One-level scan; scandir folds is_dir into the directory listing so a
+    # big instances folder costs one getdents instead of a stat per child.
+    found: list[Installation] = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and _has_bedrock_binary(entry.path):
+                    found.append(Installation(name=entry.name, path=entry.path))
+    except Exception:
+        return found
+    return found
 
 
 def discover_installations(roots: list[Path]) -> list[Installation]:
-    found: list[Installation] = []
-    for root in roots:
-        try:
-            root = root.expanduser().resolve()
-        except Exception:
-            continue
-        if not root.exists() or not root.is_dir():
-            continue
-
-        # Direct root is an installation
-        if _has_bedrock_binary(root):
-            found.append(Installation(name=root.name, path=str(root)))
-            continue
+    if not roots:
+        return []
 
-        # One-level scan
-        try:
-            for child in root.iterdir():
-                if child.is_dir() and _has_bedrock_binary(child):
-                    found.append(Installation(name=child.name, path=str(child)))
-        except Exception:
-            continue
+    # Each root is syscall-bound, so scanning them in parallel hides the
+    # latency of slow mounts behind the fast ones.
+    if len(roots) == 1:
+        found = _scan_root(roots[0])
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(roots))) as pool:
+            found = [inst for batch in pool.map(_scan_root, roots) for inst in batch]
 
     # De-dupe by resolved path
     seen: set[str] = set()
@@ -105,8 +157,11 @@ def discover_installations(roots: list[Path]) -> list[Installation]:
     return unique
 
 
-def _has_bedrock_binary(folder: Path) -> bool:
-    return (folder / "bedrock_server").exists() or (folder / "bedrock_server.exe").exists()
+def _has_bedrock_binary(folder: Path | str) -> bool:
+    folder = os.fspath(folder)
+    return os.path.exists(os.path.join(folder, "bedrock_server")) or os.path.exists(
+        os.path.join(folder, "bedrock_server.exe")
+    )
 
 
 def _parse_installation(raw: Any) -> Installation | None:
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
 import textwrap
+from collections import deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 
-from .util import keep_last, split_lines
+from .util import split_lines
+
+
+@lru_cache(maxsize=4096)
+def _wrap(part: str, width: int) -> str:
+    # Reflows hit the same (message, width) pairs over and over; memoizing
+    # here turns a full-buffer rewrap into mostly dict lookups.
+    return textwrap.fill(part, width=width)
 
 
 @dataclass(slots=True)
@@ -11,18 +20,27 @@ class LogBuffer:
     """Keeps raw log messages and produces width-wrapped output."""
 
     max_messages: int = 2000
-    _messages: list[str] = field(default_factory=list)
+    _messages: deque[str] = field(default_factory=deque)
+
+    def __post_init__(self) -> None:
+        # A bounded deque evicts old messages in O(1) on append instead of
+        # reallocating the list tail every time.
+        self._messages = deque(self._messages, maxlen=max(0, int(self.max_messages)))
 
     def append(self, message: str) -> None:
         self._messages.append(str(message))
-        self._messages = keep_last(self._messages, self.max_messages)
 
     def render(self, width: int) -> list[str]:
         width = max(20, int(width))
         rendered: list[str] = []
         for msg in self._messages:
             for part in split_lines(msg):
-                rendered.append(textwrap.fill(part, width=width))
+                # Most BDS log lines already fit; skip the wrapper (and its
+                # cache lookup) for those.
+                if len(part) <= width:
+                    rendered.append(part)
+                else:
+                    rendered.append(_wrap(part, width))
         return rendered
 
     def clear(self) -> None:
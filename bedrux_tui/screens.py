@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import shutil
 import time
 from pathlib import Path
@@ -12,10 +13,12 @@ from typing import TYPE_CHECKING, cast
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
-from textual.widgets import Button, Footer, Input, Label, ListItem, ListView, Static, ProgressBar
+from textual.widgets import Button, Footer, Input, Label, ListItem, ListView, OptionList, Static, ProgressBar
+from textual.widgets.option_list import Option
 
-from .backup import make_backup, restore_backup, list_backups, delete_backup, BackupInfo
+from .backup import make_backup_async, restore_backup, list_backups, delete_backup, BackupInfo
 from .installations import Installation, InstallationStore, discover_installations
+from .util import _run_blocking
 from .widgets import ClickableRichLog, HistoryInput, ServerStatsWidget
 from .downloader import (
     fetch_versions,
@@ -61,8 +64,16 @@ class MonitorScreen(Screen):
     def on_mount(self) -> None:
         app = cast("BedruxMonitorApp", self.app)
 
+        # Publish widget refs so app hot paths (stats tick, log writes) don't
+        # re-query the DOM on every call.
         try:
-            app._reflow_log()
+            app._stats_widget = self.query_one(ServerStatsWidget)
+            app._log_widget = self.query_one("#console_log", ClickableRichLog)
+        except Exception:
+            pass
+
+        try:
+            app._reflow_log(force=True)
         except Exception:
             pass
 
@@ -79,7 +90,11 @@ class MonitorScreen(Screen):
 
         app.write_console(f"Server: {self.installation.name}")
         app.write_console(f"Path: {self.installation.path}")
-        app.set_interval(app.config.stats_interval_s, app._tick_stats)
+
+    def on_unmount(self) -> None:
+        app = cast("BedruxMonitorApp", self.app)
+        app._stats_widget = None
+        app._log_widget = None
 
     def action_blur(self) -> None:
         try:
@@ -126,16 +141,20 @@ class MenuScreen(Screen):
         self._store = InstallationStore()
         self._installations: list[Installation] = []
         self._explicitly_selected: bool = False  # Track if user explicitly selected an item
-        self._last_click_time: float = 0.0  # For double-click detection
+        # Monotonic ns for double-click detection: immune to NTP steps and
+        # integer compares are cheaper than FP on the click path.
+        self._last_click_time_ns: int = 0
         self._last_click_index: int | None = None  # Track which item was clicked
-        self._double_click_threshold: float = 0.4  # 400ms for double-click
+        self._double_click_threshold_ns: int = 400_000_000  # 400ms for double-click
 
     def compose(self) -> ComposeResult:
         with Vertical(id="menu_container"):
             yield Static("BEDRUX", id="main_title")
 
             with Vertical(id="list_card"):
-                yield ListView(id="installations")
+                # OptionList only renders the visible rows, so big instance
+                # collections don't cost a widget per entry.
+                yield OptionList(id="installations")
 
             with Vertical(id="action_buttons"):
                 with Horizontal(id="btn_row_top"):
@@ -149,41 +168,44 @@ class MenuScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        self._load_installations()
-        self._render_list()
+        # Paint the frame first; a cold-cache disk scan shouldn't gate the
+        # first render, so loading happens in a worker.
+        self.run_worker(self._load_installations(), exclusive=True)
         try:
-            self.set_focus(self.query_one("#installations", ListView))
+            self.set_focus(self.query_one("#installations", OptionList))
         except Exception:
             pass
 
-    def _load_installations(self) -> None:
-        items = self._store.load()
-        if items:
-            self._installations = items
-            return
+    async def _load_installations(self) -> None:
+        items = await _run_blocking(self._store.load)
+        if not items:
+            bedrux_home = get_bedrux_home()
+            roots = [bedrux_home, Path.cwd() / "server", Path.cwd()]
+            items = await _run_blocking(discover_installations, roots)
+            if items:
+                await _run_blocking(self._store.save, items)
+        self._set_installations(items)
+        self._render_list()
 
-        bedrux_home = get_bedrux_home()
-        roots = [bedrux_home, Path.cwd() / "server", Path.cwd()]
-        discovered = discover_installations(roots)
-        self._installations = discovered
-        if discovered:
-            self._store.save(discovered)
+    def _set_installations(self, items: list[Installation]) -> None:
+        self._installations = items
 
     def _render_list(self) -> None:
-        lv = self.query_one("#installations", ListView)
-        lv.clear()
+        ol = self.query_one("#installations", OptionList)
 
-        for inst in self._installations:
-            lv.append(ListItem(Label(inst.name)))
+        # One add_options call: the data is O(N) but only visible rows are
+        # ever rendered.
+        ol.clear_options()
+        ol.add_options([Option(inst.name, id=str(i)) for i, inst in enumerate(self._installations)])
 
         # Don't auto-select - user must click to select
         if self._installations:
-            lv.index = None
+            ol.highlighted = None
         self._explicitly_selected = False
 
     def _selected(self) -> Installation | None:
-        lv = self.query_one("#installations", ListView)
-        idx = lv.index
+        ol = self.query_one("#installations", OptionList)
+        idx = ol.highlighted
         # Only return selected if user explicitly selected
         if not self._explicitly_selected:
             return None
@@ -192,30 +214,29 @@ class MenuScreen(Screen):
         return self._installations[idx]
 
     def action_select_prev(self) -> None:
-        lv = self.query_one("#installations", ListView)
-        if lv.index is None:
-            lv.index = 0 if self._installations else None
+        ol = self.query_one("#installations", OptionList)
+        if ol.highlighted is None:
+            ol.highlighted = 0 if self._installations else None
             self._explicitly_selected = True
             return
-        lv.index = max(0, int(lv.index) - 1)
+        ol.highlighted = max(0, int(ol.highlighted) - 1)
         self._explicitly_selected = True
 
     def action_select_next(self) -> None:
-        lv = self.query_one("#installations", ListView)
+        ol = self.query_one("#installations", OptionList)
         if not self._installations:
-            lv.index = None
+            ol.highlighted = None
             return
-        if lv.index is None:
-            lv.index = 0
+        if ol.highlighted is None:
+            ol.highlighted = 0
             self._explicitly_selected = True
             return
-        lv.index = min(len(self._installations) - 1, int(lv.index) + 1)
+        ol.highlighted = min(len(self._installations) - 1, int(ol.highlighted) + 1)
         self._explicitly_selected = True
 
     async def action_quit(self) -> None:
         app = cast("BedruxMonitorApp", self.app)
-        await app.stop_if_running()
-        app.exit()
+        await app.action_quit()
 
     def action_add(self) -> None:
         self.app.push_screen(
@@ -226,8 +247,20 @@ class MenuScreen(Screen):
             )
         )
 
-    def _on_added(self) -> None:
-        self._installations = self._store.load()
+    def _on_added(self, new_inst: Installation | None = None) -> None:
+        if new_inst is not None:
+            # The add screen just saved the store, so skip the disk re-read
+            # and append only the new row.
+            self._installations.append(new_inst)
+            try:
+                ol = self.query_one("#installations", OptionList)
+                ol.add_option(Option(new_inst.name, id=str(len(self._installations) - 1)))
+            except Exception:
+                self._render_list()
+            return
+
+        # Restores can land under arbitrary names; do the full re-sync.
+        self._set_installations(self._store.load())
         self._render_list()
 
     async def action_delete(self) -> None:
@@ -239,12 +272,16 @@ class MenuScreen(Screen):
         try:
             folder = inst.resolved_path()
             if folder.exists():
-                await asyncio.to_thread(shutil.rmtree, folder)
+                await _run_blocking(shutil.rmtree, folder)
         except Exception:
             pass
 
-        # Remove from list and save
-        self._installations = [i for i in self._installations if i != inst]
+        # Remove by path, not display name: basenames can repeat across scan
+        # roots, so filtering the list itself preserves any same-named entry
+        # and the rendered row order.
+        self._set_installations(
+            [i for i in self._installations if i.path != inst.path]
+        )
         self._store.save(self._installations)
         self._render_list()
 
@@ -264,14 +301,14 @@ class MenuScreen(Screen):
         if not inst:
             return
 
+        app = cast("BedruxMonitorApp", self.app)
         try:
-            result = await asyncio.to_thread(
-                make_backup,
+            result = await make_backup_async(
                 inst.resolved_path(),
-                inst.name
+                inst.name,
+                compresslevel=app.config.backup_compresslevel,
             )
             # Show success notification
-            app = cast("BedruxMonitorApp", self.app)
             if hasattr(app, 'notify'):
                 app.notify(f"Backup created: {result.archive_path.name}")
         except Exception:
@@ -291,36 +328,35 @@ class MenuScreen(Screen):
             case "btn_restore":
                 self.action_restore()
 
-    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+    def on_option_list_option_highlighted(self, event: OptionList.OptionHighlighted) -> None:
         """Single click highlights/selects an item."""
         self._explicitly_selected = True
 
-    async def on_list_view_selected(self, event: ListView.Selected) -> None:
+    async def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """
-        Handle ListView selection - implement double-click detection.
+        Handle selection - implement double-click detection.
         Single click = select only
         Double click = start server
         """
-        current_time = time.time()
-        lv = self.query_one("#installations", ListView)
-        current_index = lv.index
+        current_time_ns = time.monotonic_ns()
+        current_index = event.option_index
 
         # Check if this is a double-click (same item clicked within threshold)
         is_double_click = (
             self._last_click_index is not None and
             self._last_click_index == current_index and
-            (current_time - self._last_click_time) < self._double_click_threshold
+            (current_time_ns - self._last_click_time_ns) < self._double_click_threshold_ns
         )
 
         # Update click tracking
-        self._last_click_time = current_time
+        self._last_click_time_ns = current_time_ns
         self._last_click_index = current_index
         self._explicitly_selected = True
 
         # Only start server on double-click
         if is_double_click:
             # Reset to prevent triple-click starting again
-            self._last_click_time = 0.0
+            self._last_click_time_ns = 0
             self._last_click_index = None
             await self.action_start()
 
@@ -337,7 +373,7 @@ class AddInstallationScreen(Screen):
         store: InstallationStore,
         existing: list[Installation],
         *,
-        on_done: Callable[[], None],
+        on_done: Callable[[Installation], None],
     ) -> None:
         super().__init__()
         self._store = store
@@ -346,6 +382,11 @@ class AddInstallationScreen(Screen):
         self._versions: list[VersionInfo] = []
         self._selected_url: str | None = None
         self._is_installing = False
+        self._status: Static | None = None
+        self._progress: ProgressBar | None = None
+        self._buttons: list[Button] = []
+        self._last_progress_t = 0.0
+        self._last_progress: tuple[int, int] | None = None
 
     def compose(self) -> ComposeResult:
         with Vertical(id="add_container"):
@@ -378,17 +419,29 @@ class AddInstallationScreen(Screen):
                     yield Button("Cancel", id="btn_cancel")
 
     def on_mount(self) -> None:
+        # Cache the widgets the workers hammer; _update_progress alone can
+        # fire thousands of times per download, and a DOM query per event
+        # adds up.
         try:
-            self.set_focus(self.query_one("#instance_name", Input))
+            self._status = self.query_one("#status_label", Static)
+            self._progress = self.query_one("#progress_bar", ProgressBar)
+            self._buttons = [
+                self.query_one("#btn_fetch", Button),
+                self.query_one("#btn_install", Button),
+                self.query_one("#btn_cancel", Button),
+            ]
         except Exception:
             pass
 
-        # Hide progress bar initially
         try:
-            self.query_one("#progress_bar", ProgressBar).display = False
+            self.set_focus(self.query_one("#instance_name", Input))
         except Exception:
             pass
 
+        # Hide progress bar initially
+        if self._progress is not None:
+            self._progress.display = False
+
         # Auto-fetch versions on mount
         self.run_worker(self._fetch_versions(), exclusive=True)
 
@@ -398,16 +451,28 @@ class AddInstallationScreen(Screen):
         self.app.pop_screen()
 
     def _set_status(self, message: str) -> None:
-        try:
-            self.query_one("#status_label", Static).update(message)
-        except Exception:
-            pass
+        if self._status is not None:
+            try:
+                self._status.update(message)
+            except Exception:
+                pass
 
     def _update_progress(self, current: int, total: int) -> None:
+        if self._progress is None or total <= 0:
+            return
+
+        # The downloader fires this per chunk; ~30 Hz is already more than
+        # the eye can track, so drop the rest (but always land completion).
+        if (current, total) == self._last_progress:
+            return
+        now = time.monotonic()
+        if current < total and now - self._last_progress_t < 0.033:
+            return
+        self._last_progress_t = now
+        self._last_progress = (current, total)
+
         try:
-            progress = self.query_one("#progress_bar", ProgressBar)
-            if total > 0:
-                progress.update(total=total, progress=current)
+            self._progress.update(total=total, progress=current)
         except Exception:
             pass
 
@@ -423,10 +488,15 @@ class AddInstallationScreen(Screen):
         # Update version list
         try:
             version_list = self.query_one("#version_list", ListView)
-            version_list.clear()
 
-            for v in self._versions:
-                version_list.append(ListItem(Label(v.display_name)))
+            items = [ListItem(Label(v.display_name)) for v in self._versions]
+            with self.app.batch_update():
+                version_list.clear()
+                if hasattr(version_list, "extend"):
+                    version_list.extend(items)
+                else:
+                    for item in items:
+                        version_list.append(item)
 
             if self._versions:
                 version_list.index = 0
@@ -443,12 +513,8 @@ class AddInstallationScreen(Screen):
         self._is_installing = True
 
         # Disable buttons during installation
-        try:
-            self.query_one("#btn_fetch", Button).disabled = True
-            self.query_one("#btn_install", Button).disabled = True
-            self.query_one("#btn_cancel", Button).disabled = True
-        except Exception:
-            pass
+        for btn in self._buttons:
+            btn.disabled = True
 
         # Get instance name
         name_input = self.query_one("#instance_name", Input)
@@ -509,12 +575,9 @@ class AddInstallationScreen(Screen):
             return
 
         # Show progress bar
-        try:
-            progress = self.query_one("#progress_bar", ProgressBar)
-            progress.display = True
-            progress.update(total=100, progress=0)
-        except Exception:
-            pass
+        if self._progress is not None:
+            self._progress.display = True
+            self._progress.update(total=100, progress=0)
 
         # Download and install
         self._set_status("[+] Starting installation...")
@@ -558,15 +621,11 @@ class AddInstallationScreen(Screen):
 
         self._is_installing = False
         self.app.pop_screen()
-        self._on_done()
+        self._on_done(new_installation)
 
     def _enable_buttons(self) -> None:
-        try:
-            self.query_one("#btn_fetch", Button).disabled = False
-            self.query_one("#btn_install", Button).disabled = False
-            self.query_one("#btn_cancel", Button).disabled = False
-        except Exception:
-            pass
+        for btn in self._buttons:
+            btn.disabled = False
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         match event.button.id:
@@ -601,6 +660,9 @@ class RestoreScreen(Screen):
         self._on_done = on_done
         self._backups: list[BackupInfo] = []
         self._is_restoring = False
+        self._status: Static | None = None
+        self._buttons: list[Button] = []
+        self._existing_paths: set[str] = set()
 
     def compose(self) -> ComposeResult:
         with Vertical(id="restore_container"):
@@ -608,7 +670,7 @@ class RestoreScreen(Screen):
                 yield Static("Restore Backup", id="form_title")
 
                 yield Label("Available backups:", classes="field_label")
-                yield ListView(id="backup_list")
+                yield OptionList(id="backup_list")
 
                 yield Label("New instance name (optional):", classes="field_label")
                 yield Input(
@@ -625,9 +687,26 @@ class RestoreScreen(Screen):
                     yield Button("Cancel", id="btn_cancel")
 
     def on_mount(self) -> None:
+        try:
+            self._status = self.query_one("#restore_status", Static)
+            self._buttons = [
+                self.query_one("#btn_restore", Button),
+                self.query_one("#btn_delete", Button),
+                self.query_one("#btn_cancel", Button),
+            ]
+        except Exception:
+            pass
+
+        # Resolve existing paths once; _run_restore only needs membership.
+        for inst in self._existing:
+            try:
+                self._existing_paths.add(str(inst.resolved_path()))
+            except Exception:
+                continue
+
         self._load_backups()
         try:
-            self.set_focus(self.query_one("#backup_list", ListView))
+            self.set_focus(self.query_one("#backup_list", OptionList))
         except Exception:
             pass
 
@@ -637,32 +716,32 @@ class RestoreScreen(Screen):
         self._render_backup_list()
 
     def _render_backup_list(self) -> None:
-        lv = self.query_one("#backup_list", ListView)
-        lv.clear()
+        ol = self.query_one("#backup_list", OptionList)
 
+        ol.clear_options()
         if not self._backups:
-            lv.append(ListItem(Label("No backups found")))
+            ol.add_options([Option("No backups found", disabled=True)])
         else:
-            for backup in self._backups:
-                lv.append(ListItem(Label(backup.display_name)))
-
-        if self._backups:
-            lv.index = 0
+            ol.add_options(
+                [Option(backup.display_name, id=str(i)) for i, backup in enumerate(self._backups)]
+            )
+            ol.highlighted = 0
 
     def _selected_backup(self) -> BackupInfo | None:
         if not self._backups:
             return None
-        lv = self.query_one("#backup_list", ListView)
-        idx = lv.index
+        ol = self.query_one("#backup_list", OptionList)
+        idx = ol.highlighted
         if idx is None or idx < 0 or idx >= len(self._backups):
             return None
         return self._backups[idx]
 
     def _set_status(self, message: str) -> None:
-        try:
-            self.query_one("#restore_status", Static).update(message)
-        except Exception:
-            pass
+        if self._status is not None:
+            try:
+                self._status.update(message)
+            except Exception:
+                pass
 
     def action_back(self) -> None:
         if self._is_restoring:
@@ -692,15 +771,33 @@ class RestoreScreen(Screen):
         self._set_status(f"Deleting {backup.path.name}...")
 
         try:
-            success = await asyncio.to_thread(delete_backup, backup.path)
+            success = await _run_blocking(delete_backup, backup.path)
             if success:
                 self._set_status(f"Deleted: {backup.path.name}")
-                self._load_backups()
+                self._remove_backup_row(backup)
             else:
                 self._set_status("Failed to delete backup.")
         except Exception as e:
             self._set_status(f"Error: {e}")
 
+    def _remove_backup_row(self, backup: BackupInfo) -> None:
+        # Drop just the deleted row; re-scanning the backups directory per
+        # delete is O(N) for a one-item change. The `r` binding still does a
+        # full re-sync via _load_backups.
+        try:
+            idx = self._backups.index(backup)
+        except ValueError:
+            self._load_backups()
+            return
+
+        del self._backups[idx]
+        if not self._backups:
+            self._render_backup_list()
+            return
+        ol = self.query_one("#backup_list", OptionList)
+        ol.remove_option_at_index(idx)
+        ol.highlighted = min(idx, len(self._backups) - 1)
+
     async def _run_restore(self) -> None:
         backup = self._selected_backup()
         if not backup:
@@ -710,12 +807,8 @@ class RestoreScreen(Screen):
         self._is_restoring = True
 
         # Disable buttons
-        try:
-            self.query_one("#btn_restore", Button).disabled = True
-            self.query_one("#btn_delete", Button).disabled = True
-            self.query_one("#btn_cancel", Button).disabled = True
-        except Exception:
-            pass
+        for btn in self._buttons:
+            btn.disabled = True
 
         new_name = self.query_one("#new_name", Input).value.strip() or None
 
@@ -733,11 +826,8 @@ class RestoreScreen(Screen):
         try:
             instances_dir = get_bedrux_home() / "instances"
 
-            restored_path = await asyncio.to_thread(
-                restore_backup,
-                backup.path,
-                instances_dir,
-                new_name=new_name,
+            restored_path = await _run_blocking(
+                functools.partial(restore_backup, backup.path, instances_dir, new_name=new_name)
             )
 
             # Add to installations list
@@ -751,9 +841,10 @@ class RestoreScreen(Screen):
             )
 
             merged = list(self._existing)
-            existing_paths = {str(i.resolved_path()) for i in merged}
-            if str(new_installation.resolved_path()) not in existing_paths:
+            new_path = str(new_installation.resolved_path())
+            if new_path not in self._existing_paths:
                 merged.append(new_installation)
+                self._existing_paths.add(new_path)
 
             self._store.save(merged)
 
@@ -772,12 +863,8 @@ class RestoreScreen(Screen):
             self._enable_buttons()
 
     def _enable_buttons(self) -> None:
-        try:
-            self.query_one("#btn_restore", Button).disabled = False
-            self.query_one("#btn_delete", Button).disabled = False
-            self.query_one("#btn_cancel", Button).disabled = False
-        except Exception:
-            pass
+        for btn in self._buttons:
+            btn.disabled = False
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         match event.button.id:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections import deque
+import os
+import sys
+import time
 from dataclasses import dataclass
 from typing import Optional
 
@@ -21,63 +23,163 @@ class ResourceSample:
 class StatsSampler:
     """Samples CPU and RAM usage for a process + its children."""
 
-    def __init__(self, *, cpu_history_size: int = 5) -> None:
-        self._cpu_history = deque(maxlen=max(1, int(cpu_history_size)))
+    def __init__(self, *, cpu_history_size: int = 5, min_interval: float = 0.0) -> None:
+        # EWMA with alpha = 2/(N+1) tracks an N-sample moving average with a
+        # single float of state and one multiply-add per tick.
+        self._cpu_ewma = 0.0
+        self._ewma_primed = False
+        self._alpha = 2.0 / (max(1, int(cpu_history_size)) + 1)
         self._cpu_count = psutil.cpu_count(logical=True) or 1
         self._warmed = False
+        self._min_interval = max(0.0, float(min_interval))
+        self._last_ts = 0.0
+        self._last_sample: Optional[ResourceSample] = None
+
+        # Children of a BDS process are stable; re-walking /proc every tick
+        # is a syscall storm for a list that almost never changes.
+        self._children_cache: list[psutil.Process] = []
+        self._children_pid: Optional[int] = None
+        self._children_refresh_every = 5
+        self._tick = 0
+
+        # Total RAM can't change under us; one syscall at construction
+        # replaces one per tick.
+        try:
+            self._total_ram_mb = max(1, int(psutil.virtual_memory().total >> 20))
+        except Exception:
+            self._total_ram_mb = 0
+
+        # On Linux, read /proc/<pid>/stat + statm directly: two small reads
+        # per process versus psutil's wrapper objects and extra stats.
+        self._use_proc = sys.platform == "linux"
+        try:
+            self._clk_tck = float(os.sysconf("SC_CLK_TCK"))
+            self._page_size = int(os.sysconf("SC_PAGE_SIZE"))
+        except (AttributeError, ValueError, OSError):
+            self._use_proc = False
+        self._prev_jiffies: dict[int, int] = {}
+        self._prev_wall = 0.0
 
         try:
             psutil.cpu_percent(interval=None)
         except Exception:
             pass
 
-    def sample(self, proc: psutil.Process) -> Optional[ResourceSample]:
+    @staticmethod
+    def _read_proc(pid: int) -> Optional[tuple[int, int]]:
+        """Return (utime+stime jiffies, RSS pages) for `pid`, or None if gone."""
         try:
-            procs = [proc] + proc.children(recursive=True)
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                buf = f.read()
+            # Skip past the parenthesised comm field (it may contain spaces);
+            # utime/stime are stat fields 14/15, i.e. indices 11/12 after it.
+            fields = buf[buf.rfind(b")") + 2:].split()
+            jiffies = int(fields[11]) + int(fields[12])
+            with open(f"/proc/{pid}/statm", "rb") as f:
+                rss_pages = int(f.read().split()[1])
+            return jiffies, rss_pages
         except Exception:
-            procs = [proc]
+            return None
+
+    def sample(self, proc: psutil.Process) -> Optional[ResourceSample]:
+        # Resize/refresh events can trigger extra samples; serve the cached
+        # result rather than hitting psutil more often than the timer does.
+        now = time.monotonic()
+        if self._min_interval and (now - self._last_ts) < self._min_interval:
+            return self._last_sample
+
+        if (
+            self._children_pid != proc.pid
+            or self._tick % self._children_refresh_every == 0
+        ):
+            try:
+                self._children_cache = proc.children(recursive=True)
+            except Exception:
+                self._children_cache = []
+            self._children_pid = proc.pid
+        self._tick += 1
 
         cpu_sum = 0.0
         rss_bytes = 0
 
-        for p in procs:
-            try:
-                cpu_sum += p.cpu_percent(interval=None)
-                rss_bytes += p.memory_info().rss
-            except Exception:
-                continue
+        if self._use_proc:
+            pids = [proc.pid] + [c.pid for c in self._children_cache]
+            delta_wall = now - self._prev_wall if self._prev_wall else 0.0
+            new_jiffies: dict[int, int] = {}
+            dead_pids: set[int] = set()
+            for pid in pids:
+                data = self._read_proc(pid)
+                if data is None:
+                    dead_pids.add(pid)
+                    continue
+                jiffies, rss_pages = data
+                new_jiffies[pid] = jiffies
+                rss_bytes += rss_pages * self._page_size
+                prev = self._prev_jiffies.get(pid)
+                if prev is not None and delta_wall > 0:
+                    cpu_sum += (jiffies - prev) / self._clk_tck / delta_wall * 100.0
+            self._prev_jiffies = new_jiffies
+            self._prev_wall = now
+            if dead_pids:
+                self._children_cache = [
+                    c for c in self._children_cache if c.pid not in dead_pids
+                ]
+            if not self._warmed:
+                # First pass only establishes the jiffies baseline.
+                self._warmed = True
+                return None
+        else:
+            procs = [proc] + self._children_cache
+            dead: list[psutil.Process] = []
 
-        if not self._warmed:
             for p in procs:
                 try:
-                    p.cpu_percent(interval=None)
+                    with p.oneshot():
+                        cpu_sum += p.cpu_percent(interval=None)
+                        rss_bytes += p.memory_info().rss
+                except psutil.NoSuchProcess:
+                    dead.append(p)
                 except Exception:
-                    pass
-            self._warmed = True
-            return None
+                    continue
 
-        rss_mb = max(0, int(rss_bytes / 1024 / 1024))
+            if dead:
+                self._children_cache = [c for c in self._children_cache if c not in dead]
+
+            if not self._warmed:
+                for p in procs:
+                    try:
+                        p.cpu_percent(interval=None)
+                    except Exception:
+                        pass
+                self._warmed = True
+                return None
+
+        rss_mb = max(0, rss_bytes >> 20)
 
         normalized = cpu_sum / self._cpu_count if self._cpu_count else cpu_sum
         cpu_display = clamp(normalized, 0.0, 100.0)
 
-        self._cpu_history.append(cpu_display)
-        cpu_smoothed = sum(self._cpu_history) / len(self._cpu_history)
+        if not self._ewma_primed:
+            self._cpu_ewma = cpu_display
+            self._ewma_primed = True
+        else:
+            self._cpu_ewma += self._alpha * (cpu_display - self._cpu_ewma)
+        cpu_smoothed = self._cpu_ewma
 
         try:
             sys_cpu = float(psutil.cpu_percent(interval=None))
         except Exception:
             sys_cpu = 0.0
 
-        try:
-            total_ram_mb = int(psutil.virtual_memory().total / 1024 / 1024)
-        except Exception:
-            total_ram_mb = max(4096, rss_mb)
+        total_ram_mb = self._total_ram_mb or max(4096, rss_mb)
 
-        return ResourceSample(
+        result = ResourceSample(
             cpu_percent=float(cpu_smoothed),
             sys_cpu_percent=float(sys_cpu),
             raw_cpu_sum=float(cpu_sum),
             rss_mb=rss_mb,
             total_ram_mb=max(1, total_ram_mb),
         )
+        self._last_ts = now
+        self._last_sample = result
+        return result
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
-from typing import Optional
+import asyncio
+from collections.abc import Callable, Iterator
+from typing import Any, Optional
+
+
+async def _run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """Run `func` on the default executor without the contextvars copy.
+
+    asyncio.to_thread snapshots the current Context per call; nothing here
+    uses ContextVars, so run_in_executor skips that overhead. Use
+    functools.partial for keyword arguments.
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
 
 
 def clamp(value: float, lo: float, hi: float) -> float:
-    return hi if value > hi else lo if value < lo else value
+    # min/max are C-level and skip the conditional jumps of a ternary chain.
+    return min(hi, max(lo, value))
 
 
 def is_blank(value: Optional[str]) -> bool:
@@ -13,6 +25,12 @@ def is_blank(value: Optional[str]) -> bool:
 
 
 def keep_last(items: list[str], max_items: int) -> list[str]:
+    """Compat shim for list callers.
+
+    Live buffers keep their lines in deque(maxlen=...) now, which bounds
+    themselves in O(1) on append; this remains for code that holds a plain
+    list.
+    """
     if max_items <= 0:
         return []
     if len(items) <= max_items:
@@ -20,5 +38,10 @@ def keep_last(items: list[str], max_items: int) -> list[str]:
     return items[-max_items:]
 
 
-def split_lines(text: str) -> Iterable[str]:
-    return str(text).splitlines() or [""]
+def split_lines(text: str) -> Iterator[str]:
+    # Generator so single-pass consumers never build the fallback list.
+    lines = str(text).splitlines()
+    if not lines:
+        yield ""
+        return
+    yield from lines
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import datetime
+from functools import lru_cache
 
+from rich.text import Text
 from textual import events
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
@@ -9,125 +11,222 @@ from textual.reactive import reactive
 from textual.widgets import Input, Label, RichLog, Static
 
 
+# Static.update re-parses plain strings into Text on every call; these
+# renderables never change, so build them once.
+_BADGE_ONLINE = Text("ONLINE")
+_BADGE_OFFLINE = Text("OFFLINE")
+_ZERO_PCT = Text("0%")
+_ZERO_MB = Text("0 MB")
+
+
+# CPU lands on 0-100 and RSS repeats for long stretches at rest; interning
+# the formatted strings means steady readings allocate nothing per tick.
+@lru_cache(maxsize=256)
+def _fmt_pct(n: int) -> str:
+    return f"{n}%"
+
+
+@lru_cache(maxsize=256)
+def _fmt_mb(n: int) -> str:
+    return f"{n} MB"
+
+
 class ClickableRichLog(RichLog):
     """RichLog that clears focus when clicked."""
 
     def on_mouse_down(self, event: events.MouseDown) -> None:
-        try:
-            app = getattr(self, "app", None)
-            if app is not None:
-                app.set_focus(None)
-        except Exception:
-            pass
+        # Drag-selects fire a stream of mouse-downs; clearing focus that is
+        # already clear would still run blur/refresh side-effects.
+        app = self.app
+        if app.focused is not None:
+            app.set_focus(None)
 
 
 class HistoryInput(Input):
     """Input with up/down command history."""
 
+    # The Textual base still carries a __dict__, but slotting the names we
+    # add turns their lookups into fixed-offset descriptor reads.
+    __slots__ = ("_hist_offset", "_saved", "_history")
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Offset from the newest entry (0 = latest); -1 means "not
+        # browsing". End-relative indexing keeps the walk correct even if
+        # a bounded deque drops old entries mid-browse.
+        self._hist_offset: int = -1
+        self._saved: str = ""
+        self._history = None
+
+    def on_focus(self) -> None:
+        # Resolve the history container once per focus instead of walking
+        # app attributes on every arrow keypress.
+        self._history = getattr(self.app, "cmd_history", None)
+
     def on_blur(self) -> None:
-        try:
-            self._hist_pos = None
-        except Exception:
-            pass
+        self._hist_offset = -1
+        self._history = None
+
+    def on_unmount(self) -> None:
+        self._history = None
+        self._saved = ""
 
     def key_escape(self) -> None:
-        try:
-            app = getattr(self, "app", None)
-            if app is not None:
-                app.set_focus(None)
-        except Exception:
-            pass
+        self.app.set_focus(None)
 
     def key_up(self) -> None:
-        app = getattr(self, "app", None)
-        history = getattr(app, "cmd_history", []) if app else []
+        history = self._history
         if not history:
             return
 
-        pos = getattr(self, "_hist_pos", None)
-        if pos is None:
+        offset = self._hist_offset
+        if offset < 0:
             self._saved = self.value
-            pos = len(history) - 1
+            offset = 0
         else:
-            pos = max(0, int(pos) - 1)
+            offset = min(len(history) - 1, offset + 1)
 
-        self._hist_pos = pos
-        self.value = history[int(pos)]
-        self.cursor_position = len(self.value)
+        self._hist_offset = offset
+        self._replace_value(history[-1 - offset])
 
     def key_down(self) -> None:
-        app = getattr(self, "app", None)
-        history = getattr(app, "cmd_history", []) if app else []
-        pos = getattr(self, "_hist_pos", None)
-        if not history or pos is None:
+        history = self._history
+        offset = self._hist_offset
+        if not history or offset < 0:
             return
 
-        pos = int(pos)
-        if pos < len(history) - 1:
-            pos += 1
-            self._hist_pos = pos
-            self.value = history[pos]
+        if offset > 0:
+            offset = min(offset - 1, len(history) - 1)
+            self._hist_offset = offset
+            value = history[-1 - offset]
         else:
-            self.value = getattr(self, "_saved", "")
-            self._hist_pos = None
+            value = self._saved
+            self._hist_offset = -1
 
-        self.cursor_position = len(self.value)
+        self._replace_value(value)
+
+    def _replace_value(self, value: str) -> None:
+        # value and cursor_position are separate reactives; batching folds
+        # their two refreshes into one paint per keypress.
+        with self.app.batch_update():
+            self.value = value
+            self.cursor_position = len(value)
 
 
 class ServerStatsWidget(Static):
     """Compact server stats - CPU/RAM side by side."""
 
+    __slots__ = (
+        "_server_name",
+        "_name_label",
+        "_badge",
+        "_cpu_label",
+        "_ram_label",
+        "_uptime_label",
+        "_last_cpu",
+        "_last_ram",
+        "_last_uptime",
+        "_last_name",
+        "_last_online",
+        "_uptime_last_second",
+        "_uptime_last_start",
+    )
+
     is_online = reactive(False)
 
     def __init__(self, server_name: str = "Server", **kwargs) -> None:
         super().__init__(**kwargs)
         self._server_name = server_name
+        # Label references are captured in compose(); each setter runs every
+        # stats tick, and query_one walks the DOM per call.
+        self._name_label: Label | None = None
+        self._badge: Label | None = None
+        self._cpu_label: Label | None = None
+        self._ram_label: Label | None = None
+        self._uptime_label: Label | None = None
+        # Last text written to each label; Label.update repaints even when
+        # handed the same string, so identical ticks are dropped here.
+        self._last_cpu: str | None = None
+        self._last_ram: str | None = None
+        self._last_uptime: str | None = None
+        self._last_name: str | None = None
+        # Last state the badge was painted with; watch_is_online can fire
+        # again for the same value (forced reactive writes, remount).
+        self._last_online: bool | None = None
+        # Uptime only changes once per wall-clock second, but resize and
+        # refresh timers can call set_uptime more often than that.
+        self._uptime_last_second: int = -1
+        self._uptime_last_start: datetime.datetime | None = None
 
     def compose(self) -> ComposeResult:
+        self._name_label = Label(self._server_name, id="server_name")
+        self._badge = Label(_BADGE_OFFLINE, id="status_badge", classes="badge_offline")
+        self._cpu_label = Label(_ZERO_PCT, id="cpu_value", classes="resource_value")
+        self._ram_label = Label(_ZERO_MB, id="ram_value", classes="resource_value")
+        self._uptime_label = Label("00:00:00", id="uptime_value")
+
         with Vertical(id="stats_panel"):
             # Status row
             with Horizontal(id="status_row"):
-                yield Label(self._server_name, id="server_name")
-                yield Label("OFFLINE", id="status_badge", classes="badge_offline")
+                yield self._name_label
+                yield self._badge
 
             # Resource cards
             with Horizontal(id="resource_row"):
                 with Vertical(classes="resource_card"):
                     yield Label("CPU", classes="resource_label")
-                    yield Label("0%", id="cpu_value", classes="resource_value")
+                    yield self._cpu_label
 
                 with Vertical(classes="resource_card"):
                     yield Label("RAM", classes="resource_label")
-                    yield Label("0 MB", id="ram_value", classes="resource_value")
+                    yield self._ram_label
 
             # Uptime
             with Horizontal(id="uptime_row"):
                 yield Label("Uptime:", id="uptime_label")
-                yield Label("00:00:00", id="uptime_value")
+                yield self._uptime_label
+
+    def on_unmount(self) -> None:
+        # Drop the cached child references so a torn-down widget can't keep
+        # its old labels alive through a recompose; the last-value caches go
+        # with them so a remount starts from a clean slate.
+        self._name_label = None
+        self._badge = None
+        self._cpu_label = None
+        self._ram_label = None
+        self._uptime_label = None
+        self._last_cpu = None
+        self._last_ram = None
+        self._last_uptime = None
+        self._last_name = None
+        self._last_online = None
+        self._uptime_last_second = -1
+        self._uptime_last_start = None
 
     def watch_is_online(self, online: bool) -> None:
-        try:
-            badge = self.query_one("#status_badge", Label)
-            if online:
-                badge.update("ONLINE")
-                badge.remove_class("badge_offline")
-                badge.add_class("badge_online")
-            else:
-                badge.update("OFFLINE")
-                badge.remove_class("badge_online")
-                badge.add_class("badge_offline")
-                self.query_one("#cpu_value", Label).update("0%")
-                self.query_one("#ram_value", Label).update("0 MB")
-        except Exception:
-            pass
+        badge = self._badge
+        if badge is None or online == self._last_online:
+            return
+        self._last_online = online
+        if online:
+            badge.update(_BADGE_ONLINE)
+            badge.remove_class("badge_offline")
+            badge.add_class("badge_online")
+        else:
+            badge.update(_BADGE_OFFLINE)
+            badge.remove_class("badge_online")
+            badge.add_class("badge_offline")
+            if self._cpu_label is not None and self._last_cpu != "0%":
+                self._last_cpu = "0%"
+                self._cpu_label.update(_ZERO_PCT)
+            if self._ram_label is not None and self._last_ram != "0 MB":
+                self._last_ram = "0 MB"
+                self._ram_label.update(_ZERO_MB)
 
     def on_mouse_down(self, event: events.MouseDown) -> None:
-        try:
-            app = getattr(self, "app", None)
-            if app is not None:
-                app.set_focus(None)
-        except Exception:
-            pass
+        app = self.app
+        if app.focused is not None:
+            app.set_focus(None)
 
     def set_resources(
         self,
@@ -138,25 +237,91 @@ class ServerStatsWidget(Static):
         rss_mb: int,
         total_ram_mb: int,
     ) -> None:
-        try:
-            self.query_one("#cpu_value", Label).update(f"{cpu_percent:.0f}%")
-            self.query_one("#ram_value", Label).update(f"{rss_mb} MB")
-        except Exception:
-            pass
-
-    def set_uptime(self, start_time: datetime.datetime | None) -> None:
-        try:
-            label = self.query_one("#uptime_value", Label)
-            if not start_time:
-                label.update("00:00:00")
-                return
-            delta = datetime.datetime.now() - start_time
-            label.update(str(delta).split(".")[0])
-        except Exception:
-            pass
+        # The cached-label None checks replace the old try/except: they cover
+        # the only failure mode (called before compose / after teardown)
+        # without per-call exception-frame setup on the tick path.
+        if self._cpu_label is None or self._ram_label is None:
+            return
+        cpu_text = _fmt_pct(round(cpu_percent))
+        if cpu_text != self._last_cpu:
+            self._last_cpu = cpu_text
+            self._cpu_label.update(cpu_text)
+        ram_text = _fmt_mb(int(rss_mb))
+        if ram_text != self._last_ram:
+            self._last_ram = ram_text
+            self._ram_label.update(ram_text)
+
+    def set_uptime(
+        self,
+        start_time: datetime.datetime | None,
+        now: datetime.datetime | None = None,
+    ) -> None:
+        """Update the uptime readout.
+
+        The frame driver can pass a shared `now` so a dashboard of widgets
+        shares one clock read per tick instead of one each.
+        """
+        label = self._uptime_label
+        if label is None:
+            return
+        if now is None:
+            now = datetime.datetime.now()
+        sec = int(now.timestamp())
+        if sec == self._uptime_last_second and start_time is self._uptime_last_start:
+            return
+        self._uptime_last_second = sec
+        self._uptime_last_start = start_time
+        if not start_time:
+            text = "00:00:00"
+        else:
+            # Integer divmod instead of timedelta.__str__ + split: no
+            # day/microsecond formatting work, and hours keep rolling
+            # past 24 instead of turning into "1 day, ...".
+            total = int((now - start_time).total_seconds())
+            hours, rem = divmod(max(0, total), 3600)
+            minutes, seconds = divmod(rem, 60)
+            text = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        if text != self._last_uptime:
+            self._last_uptime = text
+            label.update(text)
+
+    def refresh_all(
+        self,
+        *,
+        online: bool | None = None,
+        start_time: datetime.datetime | None = None,
+        now: datetime.datetime | None = None,
+        cpu_percent: float | None = None,
+        sys_cpu_percent: float = 0.0,
+        raw_cpu_sum: float = 0.0,
+        rss_mb: int = 0,
+        total_ram_mb: int = 0,
+    ) -> None:
+        """Apply a full stats update inside one repaint batch.
+
+        Each setter refreshes on its own; batch_update coalesces the whole
+        tick into a single paint. `online=None` leaves the badge alone and
+        `cpu_percent=None` skips the resource labels.
+        """
+
+        def _apply() -> None:
+            if online is not None:
+                self.is_online = online
+            if cpu_percent is not None:
+                self.set_resources(
+                    cpu_percent=cpu_percent,
+                    sys_cpu_percent=sys_cpu_percent,
+                    raw_cpu_sum=raw_cpu_sum,
+                    rss_mb=rss_mb,
+                    total_ram_mb=total_ram_mb,
+                )
+            self.set_uptime(start_time, now)
+
+        with self.app.batch_update():
+            _apply()
 
     def set_server_name(self, name: str) -> None:
-        try:
-            self.query_one("#server_name", Label).update(name)
-        except Exception:
-            pass
+        if self._name_label is None or name == self._last_name:
+            return
+        self._last_name = name
+        self._name_label.update(name)